@@ -0,0 +1,312 @@
+import argparse
+import gzip
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+ZNN_TOKEN = {"name": "Zenon", "symbol": "ZNN", "decimals": 8, "tokenStandard": "zts1znnxxxxxxxxxxxxx9z4ulx"}
+QSR_TOKEN = {"name": "QuasarCoin", "symbol": "QSR", "decimals": 8, "tokenStandard": "zts1qsrxxxxxxxxxxxxxmrhjll"}
+
+LEDGER_PATTERN = re.compile(r"^/api/ledger/(z1[0-9a-z]{38})/(balances|plasma|fused|received|unreceived)$")
+TRANSFER_PATTERN = re.compile(r"^/api/transfer/(z1[0-9a-z]{38})/(send|receive)$")
+PLASMA_PATTERN = re.compile(r"^/api/plasma/(z1[0-9a-z]{38})/(fuse|cancel)$")
+EXPIRATION_PATTERN = re.compile(r"^/api/utilities/plasma-bot/expiration/(z1[0-9a-z]{38})$")
+
+def block_hash(address, height):
+    return hashlib.sha256(f"{address}:{height}".encode()).hexdigest()
+
+class FakeWalletHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are buffered and sent with one write, and Nagle is disabled,
+    # so small responses are not held back by delayed ACKs
+    wbufsize = 65536
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, status, data=None):
+        server = self.server
+        body = json.dumps(data).encode() if data is not None else b""
+        headers = {"Content-Type": "application/json"}
+        if server.etags and status == 200 and self.command == "GET":
+            # The data is deterministic, so a hash of the body is a strong validator
+            etag = f'"{hashlib.sha1(body).hexdigest()}"'
+            headers["ETag"] = etag
+            if self.headers.get("If-None-Match") == etag:
+                status, body = 304, b""
+        if server.compress and body and "gzip" in (self.headers.get("Accept-Encoding") or ""):
+            body = gzip.compress(body, compresslevel=6)
+            headers["Content-Encoding"] = "gzip"
+
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        server.sent(len(body))
+
+    def _read_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        try:
+            return json.loads(body) if body else None
+        except ValueError:
+            return None
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def _handle(self, method):
+        server = self.server
+        url = urlparse(self.path)
+        payload = self._read_body() if method == "POST" else None
+        server.count(method, url.path)
+
+        if method == "POST" and url.path == "/api/users/authenticate":
+            if not payload or payload.get("username") != server.username or payload.get("password") != server.password:
+                return self._reply(401, {"message": "Invalid credentials"})
+            return self._reply(200, {"token": server.token})
+
+        if self.headers.get("Authorization") != f"Bearer {server.token}":
+            return self._reply(401, {"message": "Unauthorized"})
+
+        if not server.enter():
+            return self._reply(503, {"message": "Too many requests in flight"})
+        try:
+            server.delay()
+            if server.error_rate and server.random.random() < server.error_rate:
+                return self._reply(503, {"message": "Service unavailable"})
+
+            status, data = server.route(method, url.path, parse_qs(url.query), payload)
+        finally:
+            server.leave()
+        self._reply(status, data)
+
+class FakeWalletServer(ThreadingHTTPServer):
+    """
+    Local stand-in for the Wallet API with deterministic data, configurable latency, payload sizes and error rate.
+    Covers the endpoints wrapped by ZenonWalletClient, so benchmarks never need a real node.
+    """
+
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def __init__(self, host="127.0.0.1", port=0, latency=0.0, jitter=0.0, slow_rate=0.0, slow_latency=0.5,
+                 error_rate=0.0, capacity=None, blocks=1000,
+                 unreceived=0, tokens=2, fusions=3, etags=False, compress=False, username="bench", password="bench", token="bench-token", seed=0):
+        """
+        :param port: (int, default=0) Port to listen on; 0 picks a free port
+        :param latency: (float, default=0.0) Seconds every authenticated request is delayed
+        :param jitter: (float, default=0.0) Random extra delay of up to this many seconds
+        :param slow_rate: (float, default=0.0) Fraction of authenticated requests delayed by `slow_latency`, for tail latency
+        :param slow_latency: (float, default=0.5) Extra seconds of a slow request
+        :param error_rate: (float, default=0.0) Fraction of authenticated requests answered with 503
+        :param capacity: (int, optional) Requests served at once; more are answered with 503 like an overloaded node
+        :param blocks: (int, default=1000) Received account blocks per address
+        :param unreceived: (int, default=0) Unreceived account blocks per address
+        :param tokens: (int, default=2) Token balances per address, which sets the size of the balances payload
+        :param fusions: (int, default=3) Fusion entries per address
+        :param etags: (bool, default=False) Send an ETag with GET answers and answer matching If-None-Match requests with 304
+        :param compress: (bool, default=False) Gzip response bodies for clients that accept it
+        """
+        super().__init__((host, port), FakeWalletHandler)
+        self.latency = latency
+        self.jitter = jitter
+        self.slow_rate = slow_rate
+        self.slow_latency = slow_latency
+        self.error_rate = error_rate
+        self.capacity = capacity
+        self.in_flight = 0
+        self.blocks = blocks
+        self.unreceived = unreceived
+        self.tokens = tokens
+        self.fusions = fusions
+        self.etags = etags
+        self.compress = compress
+        self.username = username
+        self.password = password
+        self.token = token
+        self.random = random.Random(seed)
+        self.requests = {}
+        self.bytes_sent = 0
+        self.lock = threading.Lock()
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Serves requests on a background thread and returns the base URL"""
+        self.thread = threading.Thread(target=self.serve_forever, name="FakeWalletServer", daemon=True)
+        self.thread.start()
+        return self.url
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        if self.thread is not None:
+            self.thread.join()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def count(self, method, path):
+        with self.lock:
+            self.requests[(method, path)] = self.requests.get((method, path), 0) + 1
+
+    def sent(self, size):
+        with self.lock:
+            self.bytes_sent += size
+
+    def enter(self):
+        with self.lock:
+            if self.capacity is not None and self.in_flight >= self.capacity:
+                return False
+            self.in_flight += 1
+            return True
+
+    def leave(self):
+        with self.lock:
+            self.in_flight -= 1
+
+    def delay(self):
+        delay = self.latency + (self.random.random() * self.jitter if self.jitter else 0.0)
+        if self.slow_rate and self.random.random() < self.slow_rate:
+            delay += self.slow_latency
+        if delay > 0:
+            time.sleep(delay)
+
+    def balances(self, address):
+        balances = {}
+        for i in range(self.tokens):
+            if i == 0:
+                token = ZNN_TOKEN
+            elif i == 1:
+                token = QSR_TOKEN
+            else:
+                standard = f"zts1{hashlib.sha256(str(i).encode()).hexdigest()[:20]}"
+                token = {"name": f"Token {i}", "symbol": f"TK{i}", "decimals": i % 9, "tokenStandard": standard}
+            balances[token["tokenStandard"]] = {"token": token, "balance": str(10 ** 12 + i * 123456789)}
+        return {"address": address, "blockCount": self.blocks, "balanceInfoMap": balances}
+
+    def block(self, address, height):
+        return {
+            "hash": block_hash(address, height),
+            "height": height,
+            "address": address,
+            "toAddress": address,
+            "amount": str(100000000 + height),
+            "tokenStandard": ZNN_TOKEN["tokenStandard"],
+            "token": ZNN_TOKEN,
+            "confirmationDetail": {"numConfirmations": 10, "momentumHeight": 1000000 + height,
+                                   "momentumTimestamp": 1700000000 + height * 10},
+        }
+
+    def page(self, address, query, total):
+        try:
+            pageIndex = int(query.get("pageIndex", ["0"])[0])
+            pageSize = int(query.get("pageSize", ["50"])[0])
+        except ValueError:
+            return 400, {"message": "Invalid page"}
+        # Newest first, like the real API
+        top = total - pageIndex * pageSize
+        blocks = [self.block(address, height) for height in range(top, max(top - pageSize, 0), -1)]
+        return 200, {"count": total, "list": blocks, "more": top - pageSize > 0}
+
+    def route(self, method, path, query, payload):
+        """Returns the (status, data) answer for an authenticated request"""
+        match = LEDGER_PATTERN.match(path)
+        if match and method == "GET":
+            address, resource = match.groups()
+            if resource == "balances":
+                return 200, self.balances(address)
+            if resource == "plasma":
+                return 200, {"currentPlasma": 21000, "maxPlasma": 21000, "qsrAmount": str(self.fusions * 1000000000)}
+            if resource == "fused":
+                entries = [{"qsrAmount": "1000000000", "beneficiary": address, "expirationHeight": 1000000 + i * 360,
+                            "id": block_hash(address, -i)} for i in range(self.fusions)]
+                return 200, {"qsrAmount": str(self.fusions * 1000000000), "count": self.fusions, "list": entries}
+            if resource == "received":
+                return self.page(address, query, self.blocks)
+            return self.page(address, query, self.unreceived)
+
+        match = TRANSFER_PATTERN.match(path)
+        if match and method == "POST":
+            address, action = match.groups()
+            if action == "send" and not (payload and payload.get("address") and payload.get("amount")):
+                return 400, {"message": "address and amount are required"}
+            return 200, self.block(address, self.blocks + 1)
+
+        match = PLASMA_PATTERN.match(path)
+        if match and method == "POST":
+            return 200, self.block(match.group(1), self.blocks + 1)
+
+        match = EXPIRATION_PATTERN.match(path)
+        if match and method == "GET":
+            return 200, (datetime(2030, 1, 1, tzinfo=timezone.utc) + timedelta(hours=len(match.group(1)))).isoformat()
+
+        if path == "/api/utilities/plasma-bot/fuse" and method == "POST":
+            return 200, None
+        if path == "/api/utilities/address/validate" and method == "POST":
+            address = query.get("address", [""])[0]
+            return 200, bool(re.fullmatch(r"z1[0-9a-z]{38}", address))
+        if path == "/api/auto-receiver/status" and method == "GET":
+            return 200, {"isRunning": True, "queueSize": 0}
+        if path == "/api/wallet/status" and method == "GET":
+            return 200, {"isInitialized": True, "isUnlocked": True}
+        if path == "/api/wallet/accounts":
+            accounts = [{"address": f"z1q{i:037d}", "accountIndex": i} for i in range(10)]
+            return 200, {"count": len(accounts), "list": accounts}
+        if path in ("/api/wallet/init", "/api/wallet/restore", "/api/wallet/lock", "/api/wallet/unlock") and method == "POST":
+            return 200, None
+
+        return 404, {"message": f"Unknown endpoint {method} {path}"}
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in Wallet API server for benchmarks")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds every request is delayed")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random extra delay in seconds")
+    parser.add_argument("--slow-rate", type=float, default=0.0, help="Fraction of requests delayed by --slow-latency")
+    parser.add_argument("--slow-latency", type=float, default=0.5, help="Extra seconds of a slow request")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 503")
+    parser.add_argument("--capacity", type=int, help="Requests served at once; more are answered with 503")
+    parser.add_argument("--blocks", type=int, default=1000, help="Received account blocks per address")
+    parser.add_argument("--unreceived", type=int, default=0, help="Unreceived account blocks per address")
+    parser.add_argument("--tokens", type=int, default=2, help="Token balances per address")
+    parser.add_argument("--etags", action="store_true", help="Send ETags and answer matching conditional requests with 304")
+    parser.add_argument("--compress", action="store_true", help="Gzip response bodies for clients that accept it")
+    args = parser.parse_args()
+
+    server = FakeWalletServer(args.host, args.port, latency=args.latency, jitter=args.jitter,
+                              slow_rate=args.slow_rate, slow_latency=args.slow_latency, error_rate=args.error_rate,
+                              capacity=args.capacity, blocks=args.blocks, unreceived=args.unreceived, tokens=args.tokens,
+                              etags=args.etags, compress=args.compress)
+    print(f"Fake Wallet API listening on {server.url} (username={server.username}, password={server.password})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+import argparse
+import json
+import logging
+import sys
+import time
+from module import (ZenonWalletClient, ZenonWalletConfig, RetryPolicy, Metrics, RateLimiter, HedgePolicy, CircuitBreaker,
+                    ConditionalCache)
+from .fake_server import FakeWalletServer
+
+WORKLOADS = {}
+
+def workload(name):
+    """Registers a benchmark; the function runs it on a client and returns the number of operations"""
+    def register(func):
+        WORKLOADS[name] = func
+        return func
+    return register
+
+def bench_address(i):
+    return f"z1q{i:037d}"
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a sorted list"""
+    if not values:
+        return None
+    return values[min(len(values) - 1, max(0, int(round(fraction * len(values))) - 1))]
+
+@workload("balances")
+def bench_balances(client, args):
+    """One ledger_account_info call after another"""
+    for i in range(args.requests):
+        client.ledger_account_info(bench_address(i % args.accounts))
+    return args.requests
+
+@workload("balances_many")
+def bench_balances_many(client, args):
+    """ledger_account_info_many over `requests` addresses"""
+    addresses = (bench_address(i % args.accounts) for i in range(args.requests))
+    return sum(1 for _ in client.ledger_account_info_many(addresses, max_concurrency=args.concurrency, ordered=False))
+
+@workload("plasma_many")
+def bench_plasma_many(client, args):
+    """ledger_plasma_info_many over `requests` addresses"""
+    addresses = (bench_address(i % args.accounts) for i in range(args.requests))
+    return sum(1 for _ in client.ledger_plasma_info_many(addresses, max_concurrency=args.concurrency, ordered=False))
+
+@workload("received_pages")
+def bench_received_pages(client, args):
+    """Full received history of every account with background page prefetch; operations are blocks"""
+    return sum(sum(1 for _ in client.iter_received_blocks(bench_address(i), pageSize=args.page_size))
+               for i in range(args.accounts))
+
+@workload("received_stream")
+def bench_received_stream(client, args):
+    """Full received history of every account decoded while it downloads; operations are blocks"""
+    return sum(sum(1 for _ in client.iter_received_blocks(bench_address(i), pageSize=args.page_size, stream=True))
+               for i in range(args.accounts))
+
+@workload("received_poll")
+def bench_received_poll(client, args):
+    """Polls the newest page of received blocks of every account again and again, like a deposit watcher"""
+    for i in range(args.requests):
+        client.ledger_received_account_blocks(bench_address(i % args.accounts), pageSize=args.page_size)
+    return args.requests
+
+@workload("fused")
+def bench_fused(client, args):
+    """One ledger_fusion_entries call after another"""
+    for i in range(args.requests):
+        client.ledger_fusion_entries(bench_address(i % args.accounts))
+    return args.requests
+
+@workload("send")
+def bench_send(client, args):
+    """One send_tokens call after another"""
+    for i in range(args.requests):
+        client.send_tokens(sender=bench_address(0), receiver=bench_address(1 + i % args.accounts), amount="0.00000001")
+    return args.requests
+
+@workload("wallet")
+def bench_wallet(client, args):
+    """One wallet_status call after another"""
+    for _ in range(args.requests):
+        client.wallet_status()
+    return args.requests
+
+@workload("validate_remote")
+def bench_validate_remote(client, args):
+    """validate_addresses against the server endpoint"""
+    addresses = (bench_address(i % args.accounts) for i in range(args.requests))
+    return sum(1 for _ in client.validate_addresses(addresses, remote=True, max_concurrency=args.concurrency))
+
+def run_workload(name, url, args, server=None):
+    """Runs one workload on a fresh client and returns its results; the fake server also reports the body bytes it sent"""
+    latencies = []
+    statuses = []
+
+    def record(event):
+        if event["type"] == "request":
+            latencies.append(event["latency"])
+            statuses.append(event["status"])
+
+    metrics = Metrics()
+    config = ZenonWalletConfig(api_url=url, username=args.username, password=args.password,
+                               pool_size=max(args.concurrency, 1),
+                               retry_policy=RetryPolicy(max_retries=args.retries, backoff_factor=args.backoff))
+    rate_limiter = None
+    if args.adaptive or args.rate:
+        rate_limiter = RateLimiter(default={"rate": args.rate, "concurrency": max(1, min(args.concurrency, 10)),
+                                            "max_concurrency": max(args.concurrency, 10)})
+    hedge = HedgePolicy(percentile=args.hedge, budget=args.hedge_budget) if args.hedge else None
+    circuit_breaker = CircuitBreaker() if args.circuit_breaker else None
+    conditional = ConditionalCache() if args.conditional else None
+    client = ZenonWalletClient(config, metrics=metrics, rate_limiter=rate_limiter, hedge=hedge,
+                               circuit_breaker=circuit_breaker, conditional=conditional)
+    try:
+        # Authenticate and open a connection before timing
+        client.wallet_status()
+        metrics.add_hook(record)
+
+        bytes_before = server.bytes_sent if server is not None else None
+        start = time.perf_counter()
+        operations = WORKLOADS[name](client, args)
+        elapsed = time.perf_counter() - start
+        bytes_received = server.bytes_sent - bytes_before if server is not None else None
+    finally:
+        client.close()
+
+    latencies.sort()
+    errors = sum(1 for status in statuses if status is None or status >= 400)
+    p50 = percentile(latencies, 0.50)
+    p99 = percentile(latencies, 0.99)
+    return {
+        "workload": name,
+        "operations": operations,
+        "requests": len(latencies),
+        "errors": errors,
+        "seconds": elapsed,
+        "ops_per_second": operations / elapsed if elapsed else None,
+        "requests_per_second": len(latencies) / elapsed if elapsed else None,
+        "p50_ms": p50 * 1000 if p50 is not None else None,
+        "p99_ms": p99 * 1000 if p99 is not None else None,
+        "bytes_received": bytes_received,
+    }
+
+def print_results(results):
+    print(f"{'workload':<18}{'ops':>9}{'ops/s':>11}{'requests':>10}{'req/s':>10}{'p50 ms':>9}{'p99 ms':>9}{'errors':>8}{'KB':>11}")
+    for r in results:
+        p50 = f"{r['p50_ms']:.2f}" if r["p50_ms"] is not None else "-"
+        p99 = f"{r['p99_ms']:.2f}" if r["p99_ms"] is not None else "-"
+        received = f"{r['bytes_received'] / 1024:.1f}" if r.get("bytes_received") is not None else "-"
+        print(f"{r['workload']:<18}{r['operations']:>9}{r['ops_per_second']:>11.1f}{r['requests']:>10}"
+              f"{r['requests_per_second']:>10.1f}{p50:>9}{p99:>9}{r['errors']:>8}{received:>11}")
+
+def compare(results, baseline_path, max_regression):
+    """Returns the workloads whose throughput dropped by more than `max_regression` against a saved run"""
+    with open(baseline_path) as f:
+        baseline = {r["workload"]: r for r in json.load(f)["results"]}
+
+    regressions = []
+    for r in results:
+        before = baseline.get(r["workload"])
+        if before and before["ops_per_second"] and r["ops_per_second"] < before["ops_per_second"] * (1 - max_regression):
+            regressions.append((r["workload"], before["ops_per_second"], r["ops_per_second"]))
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks ZenonWalletClient against a local fake Wallet API")
+    parser.add_argument("workloads", nargs="*", help=f"Workloads to run (default: all): {', '.join(WORKLOADS)}")
+    parser.add_argument("--url", help="Benchmark an already running server instead of starting the fake one")
+    parser.add_argument("--username", default="bench")
+    parser.add_argument("--password", default="bench")
+    parser.add_argument("--requests", type=int, default=500, help="Requests per request-based workload")
+    parser.add_argument("--accounts", type=int, default=5, help="Distinct addresses; paginated workloads read every one")
+    parser.add_argument("--concurrency", type=int, default=10, help="max_concurrency for bulk workloads")
+    parser.add_argument("--page-size", type=int, default=1024, help="pageSize for paginated workloads")
+    parser.add_argument("--retries", type=int, default=2, help="Client retries for idempotent requests")
+    parser.add_argument("--backoff", type=float, default=0.01, help="Client retry backoff factor in seconds")
+    parser.add_argument("--latency", type=float, default=0.001, help="Fake server delay per request in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Fake server random extra delay in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of fake server responses that are 503")
+    parser.add_argument("--capacity", type=int, help="Requests the fake server serves at once; more are answered with 503")
+    parser.add_argument("--adaptive", action="store_true", help="Use a RateLimiter with adaptive concurrency")
+    parser.add_argument("--rate", type=float, help="RateLimiter requests per second per endpoint class")
+    parser.add_argument("--hedge", type=float, help="Hedge GET requests slower than this latency percentile, e.g. 0.95")
+    parser.add_argument("--hedge-budget", type=float, default=0.05, help="Hedges allowed per request")
+    parser.add_argument("--circuit-breaker", action="store_true", help="Use a CircuitBreaker with default settings")
+    parser.add_argument("--slow-rate", type=float, default=0.0, help="Fraction of fake server responses delayed by --slow-latency")
+    parser.add_argument("--slow-latency", type=float, default=0.2, help="Extra seconds of a slow fake server response")
+    parser.add_argument("--conditional", action="store_true", help="Use a ConditionalCache; the fake server then sends ETags")
+    parser.add_argument("--compress", action="store_true", help="Let the fake server gzip response bodies")
+    parser.add_argument("--blocks", type=int, default=5000, help="Received account blocks per address on the fake server")
+    parser.add_argument("--tokens", type=int, default=2, help="Token balances per address on the fake server")
+    parser.add_argument("--json", dest="json_path", help="Write the results to this file")
+    parser.add_argument("--baseline", help="Results file of an earlier run; exits with 1 when throughput regressed")
+    parser.add_argument("--max-regression", type=float, default=0.2, help="Allowed throughput drop against the baseline")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.CRITICAL, format="%(asctime)s - %(levelname)s - %(message)s")
+
+    names = args.workloads or list(WORKLOADS)
+    unknown = [name for name in names if name not in WORKLOADS]
+    if unknown:
+        parser.error(f"Unknown workloads: {', '.join(unknown)}")
+
+    server = None
+    url = args.url
+    if url is None:
+        server = FakeWalletServer(latency=args.latency, jitter=args.jitter, slow_rate=args.slow_rate,
+                                  slow_latency=args.slow_latency, error_rate=args.error_rate,
+                                  capacity=args.capacity, blocks=args.blocks, tokens=args.tokens, etags=args.conditional,
+                                  compress=args.compress, username=args.username, password=args.password)
+        url = server.start()
+
+    try:
+        results = [run_workload(name, url, args, server) for name in names]
+    finally:
+        if server is not None:
+            server.stop()
+
+    print_results(results)
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump({"settings": vars(args), "results": results}, f, indent=2)
+
+    if args.baseline:
+        regressions = compare(results, args.baseline, args.max_regression)
+        for name, before, after in regressions:
+            print(f"Regression in {name}: {before:.1f} -> {after:.1f} ops/s")
+        if regressions:
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
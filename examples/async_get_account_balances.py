@@ -0,0 +1,18 @@
+import asyncio
+import logging
+from module import AsyncZenonWalletClient
+
+async def main():
+    async with AsyncZenonWalletClient() as client:
+        addresses = [client.test_address, client.account_address_1, client.account_address_2]
+
+        # Ledger: Get the account info for all addresses at once
+        results = await asyncio.gather(*(client.ledger_account_info(address) for address in addresses))
+        for address, ledger_account_info in zip(addresses, results):
+            if ledger_account_info.get('status') == 200:
+                logging.info(f"Ledger account info {address}: {ledger_account_info.get('data')}")
+            else:
+                logging.error(f"API call failed for {address}: {ledger_account_info.get('status')}")
+
+if __name__ == "__main__":
+    asyncio.run(main())
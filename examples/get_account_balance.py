@@ -1,5 +1,5 @@
 import logging
-from module import ZenonWalletClient
+from module import ZenonWalletClient, parse_balances
 
 if __name__ == "__main__":
     client = ZenonWalletClient()
@@ -10,26 +10,17 @@ if __name__ == "__main__":
     # Ledger: Get the account info by address
     ledger_account_info = client.ledger_account_info(address)
     if ledger_account_info.get('status') == 200:
-        data = ledger_account_info.get('data')
-        balance_info_map = data.get('balanceInfoMap')
-        token_count = len(balance_info_map)
+        balances = parse_balances(ledger_account_info.get('data'))
 
-        print("Number of tokens:", token_count)
+        print("Number of tokens:", len(balances))
 
-        for token_standard, info in balance_info_map.items():
-            token_name = info["token"]["name"]
-            token_symbol = info["token"]["symbol"]
-            token_decimals = info["token"]["decimals"]
-            raw_balance_str = info["balance"]
-            balance_value = int(raw_balance_str) / (10 ** token_decimals)
-            
+        for balance in balances:
             print("---")
-            print(f"Token Standard: {token_standard}")
-            print(f"  Name: {token_name}")
-            print(f"  Symbol: {token_symbol}")
-            print(f"  Decimals: {token_decimals}")
-            print(f"  Balance: {balance_value}")
-
+            print(f"Token Standard: {balance.token.tokenStandard}")
+            print(f"  Name: {balance.token.name}")
+            print(f"  Symbol: {balance.token.symbol}")
+            print(f"  Decimals: {balance.token.decimals}")
+            print(f"  Balance: {balance.format()}")
 
     else:
         logging.error(f"API call failed: {ledger_account_info.get('status')}")
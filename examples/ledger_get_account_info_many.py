@@ -0,0 +1,16 @@
+import logging
+from module import ZenonWalletClient
+
+if __name__ == "__main__":
+    client = ZenonWalletClient()
+
+    addresses = [client.test_address, client.account_address_1, client.account_address_2]
+
+    # Ledger: Get the account info for many addresses, 10 requests at a time
+    for address, ledger_account_info in client.ledger_account_info_many(addresses, max_concurrency=10):
+        if ledger_account_info.get('status') == 200:
+            logging.info(f"Ledger account info {address}: {ledger_account_info.get('data')}")
+        else:
+            logging.error(f"API call failed for {address}: {ledger_account_info.get('status')}")
+
+    client.close()
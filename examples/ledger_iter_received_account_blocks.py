@@ -0,0 +1,18 @@
+import logging
+from module import ZenonWalletClient, ZenonWalletAPIError
+
+if __name__ == "__main__":
+    client = ZenonWalletClient()
+
+    address = client.test_address
+
+    # Ledger: Iterate over the full history of received account blocks, one page in memory at a time
+    try:
+        block_count = 0
+        for block in client.iter_received_blocks(address):
+            block_count += 1
+        logging.info(f"Received account blocks for {address}: {block_count}")
+    except ZenonWalletAPIError as e:
+        logging.error(e)
+
+    client.close()
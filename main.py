@@ -1,6 +1,5 @@
 import logging
-import time
-from module import ZenonWalletClient
+from module import ZenonWalletClient, Metrics, PlasmaWatcher, parse_balances
 
 def get_current_plasma(address):
     """Ledger: Get plasma info by address"""
@@ -14,40 +13,14 @@ def get_current_plasma(address):
 
 def get_balances(address):
     """Ledger: Get the account info by address"""
-    start = time.time()
     ledger_account_info = client.ledger_account_info(address)
-    end = time.time()
-
-    print(f"Time to get ledger info: {end - start:.4f} seconds")
-
-    start = time.time()
 
     if ledger_account_info.get('status') != 200:
         logging.error(f"API call failed: {ledger_account_info.get('status')}")
         return False
 
-    data = ledger_account_info.get('data')
-    balance_info_map = data.get('balanceInfoMap')
-    token_count = len(balance_info_map)
-
-    token_balances = []
-
-    for token_standard, info in balance_info_map.items():
-        token_name = info["token"]["name"]
-        token_symbol = info["token"]["symbol"]
-        token_decimals = info["token"]["decimals"]
-        raw_balance_str = info["balance"]
-        balance_value = int(raw_balance_str) / (10 ** token_decimals)
-
-        token_balances.append({
-            "name": token_name,
-            "symbol": token_symbol,
-            "decimals": token_decimals,
-            "balance": balance_value
-        })
-
-    end = time.time()
-    print(f"Time to parse balances: {end - start:.4f} seconds")
+    # Raw integer amounts with interned token metadata; use balance.format() or balance.amount for exact values
+    token_balances = parse_balances(ledger_account_info.get('data'))
     return token_balances
 
 def generate_plasma(address):
@@ -55,22 +28,16 @@ def generate_plasma(address):
     generate_plasma_bot = client.generate_plasma_bot(address)
     if generate_plasma_bot.get("status") == 200:
         logging.info(f"Generated plasma for {address}: {generate_plasma_bot.get('data')}")
+        plasma_watcher.notify_generated(address)
         return generate_plasma_bot.get('data')
     else:
         logging.error(f"API call failed: {generate_plasma_bot.get('status')}")
         return False
 
-def wait_for_plasma(address, timeout=1800, interval=120):
-    """Wait for plasma with interval and timeout"""
-    start_time = time.time()
-    while True:
-        if get_current_plasma(address):
-            return True
-        elapsed = time.time() - start_time
-        if elapsed >= timeout:
-            return False
-        logging.info(f"Waiting for plasma. Try again after {interval} seconds. (elapsed: {int(elapsed)} sec)")
-        time.sleep(interval)
+def wait_for_plasma(address, timeout=1800):
+    """Wait for plasma with timeout. The shared plasma watcher polls all waiting addresses from one thread"""
+    logging.info(f"Waiting for plasma on {address}. (timeout: {timeout} sec)")
+    return plasma_watcher.watch(address, timeout=timeout).result()
 
 def send_tokens(**kwargs):
     """Send tokens to an address"""
@@ -113,7 +80,9 @@ def send_tokens_with_plasma(**kwargs):
     return False
 
 if __name__ == "__main__":
-    client = ZenonWalletClient()
+    metrics = Metrics()
+    client = ZenonWalletClient(metrics=metrics)
+    plasma_watcher = PlasmaWatcher(client)
 
     print(get_balances(client.test_address))
 
@@ -160,4 +129,8 @@ if __name__ == "__main__":
     # else:
     #     logging.error(f"API call failed: {receive_account_block.get('status')}")
 
+    # Request latency, decode time and status codes per endpoint
+    print(metrics.to_prometheus())
+
+    plasma_watcher.close()
     client.close()
\ No newline at end of file
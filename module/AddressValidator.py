@@ -0,0 +1,61 @@
+from functools import lru_cache
+
+BECH32_CHARSET = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
+BECH32_GENERATOR = (0x3b6a57b2, 0x26508e6d, 0x1ea119fa, 0x3d4233dd, 0x2a1462b3)
+BECH32_VALUES = {character: value for value, character in enumerate(BECH32_CHARSET)}
+
+ADDRESS_HRP = "z"
+ADDRESS_LENGTH = 40      # "z1" + 32 data characters + 6 checksum characters
+ADDRESS_CORE_BYTES = 20  # 1 byte address type + 19 bytes hash
+
+def _polymod(values):
+    checksum = 1
+    for value in values:
+        top = checksum >> 25
+        checksum = (checksum & 0x1ffffff) << 5 ^ value
+        for i in range(5):
+            if (top >> i) & 1:
+                checksum ^= BECH32_GENERATOR[i]
+    return checksum
+
+_HRP_EXPANDED = [ord(c) >> 5 for c in ADDRESS_HRP] + [0] + [ord(c) & 31 for c in ADDRESS_HRP]
+
+@lru_cache(maxsize=65536)
+def is_valid_address(address):
+    """
+    Checks a z1 address locally: bech32 format, "z" prefix, 20-byte core and checksum. No network call is made.
+    Results are memoized, so repeated addresses cost a dictionary lookup.
+
+    :param address: (str, required)
+    :return: (bool)
+    """
+    if not isinstance(address, str) or len(address) != ADDRESS_LENGTH:
+        return False
+
+    # bech32 allows either case, but not both in one string
+    if address.lower() != address and address.upper() != address:
+        return False
+    address = address.lower()
+
+    if not address.startswith(ADDRESS_HRP + "1"):
+        return False
+
+    try:
+        values = [BECH32_VALUES[c] for c in address[len(ADDRESS_HRP) + 1:]]
+    except KeyError:
+        return False
+
+    # 32 characters of 5 bits are exactly the 20 core bytes, so no padding bits can be set
+    if (len(values) - 6) * 5 != ADDRESS_CORE_BYTES * 8:
+        return False
+
+    return _polymod(_HRP_EXPANDED + values) == 1
+
+def validate_addresses(addresses):
+    """
+    Checks many addresses locally
+
+    :param addresses: (iterable of str, required)
+    :return: list of `(address, valid)` pairs in input order
+    """
+    return [(address, is_valid_address(address)) for address in addresses]
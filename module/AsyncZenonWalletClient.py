@@ -0,0 +1,842 @@
+import sys
+import asyncio
+import logging
+import time
+import urllib.parse
+import json
+from collections import deque
+from dotenv import load_dotenv, find_dotenv
+from .AddressValidator import is_valid_address
+from .JsonStream import JsonArrayStream
+from .LoadBalancer import LoadBalancer, is_read_endpoint
+from .ZenonWalletClient import ZenonWalletAPIError, JSON_HEADERS, PAGE_SIZE_LIMITS, STREAM_CHUNK_SIZE
+from .SingleFlight import AsyncSingleFlight
+from .TokenCache import TokenCache
+from .ZenonWalletConfig import ZenonWalletConfig
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp is only needed for the async client
+    aiohttp = None
+
+def _wire_size(response):
+    """Returns the body bytes of a response read from the wire so far, before decompression"""
+    size = getattr(response.content, "total_raw_bytes", None)
+    if size is None:
+        # Older aiohttp only counts decompressed bytes; the Content-Length of a complete body is its wire size
+        size = int(response.headers.get("Content-Length") or response.content.total_bytes)
+    return size
+
+class AsyncZenonWalletClient:
+
+    def __init__(self, config=None, cache=None, coalesce=False, metrics=None, rate_limiter=None, hedge=None,
+                 circuit_breaker=None, conditional=None):
+        """
+        Initializes the asyncio client. The shared connection pool is created on first use
+        and authentication happens before the first request, since neither can be awaited from the constructor.
+        Without a config, the settings are loaded from the .env file and the process exits when none is found.
+
+        :param config: (ZenonWalletConfig, optional) Explicit settings instead of the .env file; `pool_size` defaults to 100
+        :param cache: (ResponseCache, optional) Cache for read-only ledger and utility responses
+        :param coalesce: (bool, default=False) Merge identical concurrent GET requests into a single HTTP call
+        :param metrics: (Metrics, optional) Records latency, decode time, status codes and bytes per endpoint template
+        :param rate_limiter: (RateLimiter, optional) Limits the request rate and requests in flight per endpoint class
+        :param hedge: (HedgePolicy, optional) Sends a duplicate of GET requests that are slower than usual and uses the first answer
+        :param circuit_breaker: (CircuitBreaker, optional) Fails requests fast while their endpoint keeps failing
+        :param conditional: (ConditionalCache, optional) Sends GET requests with the ETag/Last-Modified of the last answer and serves 304 answers from it
+        """
+        if aiohttp is None:
+            raise ImportError("AsyncZenonWalletClient requires aiohttp (pip install aiohttp)")
+
+        if config is None:
+            logging.basicConfig(level=logging.DEBUG, format="%(asctime)s - %(levelname)s - %(message)s")
+
+            try:
+                # Attempt to locate the .env file, and raise an error if it is not found.
+                env_file = find_dotenv(raise_error_if_not_found=True)
+                load_dotenv(env_file)
+                logging.info("Environment variables loaded from .env file.")
+            except Exception as e:
+                logging.error(f"Failed to load environment variables from .env file: {e}")
+                sys.exit(1)
+
+            config = ZenonWalletConfig.from_env()
+
+        self.config = config
+        self.username = config.username
+        self.password = config.password
+        self.api_url = config.api_url
+        self.secret = config.secret
+        self.address = config.address
+        self.mnemonic = config.mnemonic
+
+        self.test_address = "z1qqjnwjjpnue8xmmpanz6csze6tcmtzzdtfsww7"
+        self.account_address_1 = "z1qr00j9wkcyvgz567sygnjxshnkq3xqxsc0t7cv"
+        self.account_address_2 = "z1qzg4377yxss6m0duu38ntc0zu3s0thn9rwze3f"
+
+        self.pool_size = config.pool_size or 100
+        self.cache = cache
+        self.single_flight = AsyncSingleFlight() if coalesce else None
+        self.metrics = metrics
+        self.rate_limiter = rate_limiter
+        self.hedge = hedge
+        self.circuit_breaker = circuit_breaker
+        self.conditional = conditional
+        # Read-only calls are spread over the read instances; everything else stays on the primary api_url
+        self.load_balancer = LoadBalancer(config.read_urls) if config.read_urls else None
+        self.json_codec = config.json_codec
+        self.token_cache = TokenCache(config.token_cache_path) if config.token_cache_path else None
+        self.session = None
+        self.headers = {}
+        self._auth_lock = None
+
+        if config.token:
+            self.headers["Authorization"] = f"Bearer {config.token}"
+
+    async def __aenter__(self):
+        await self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def _get_session(self):
+        """
+        Returns the shared session, creating its connection pool on first use.
+        """
+        if self.session is None or self.session.closed:
+            # Connections are kept alive and reused from the pool; retries are handled in _send
+            connector = aiohttp.TCPConnector(limit=self.pool_size)
+            timeout = aiohttp.ClientTimeout(total=self.config.timeout)
+            self.session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+        return self.session
+
+    async def _ensure_authenticated(self):
+        """
+        Authenticates once, even when many requests are started before the first token arrives,
+        reusing a token from the token cache when possible.
+        """
+        if self._auth_lock is None:
+            self._auth_lock = asyncio.Lock()
+        async with self._auth_lock:
+            if self.headers.get("Authorization"):
+                return
+
+            if self.token_cache is not None:
+                key = TokenCache.key(self.api_url, self.username)
+                token = self.token_cache.load(key)
+                if token:
+                    self.headers["Authorization"] = f"Bearer {token}"
+                    return
+
+            token = await self.authenticate()
+            if token and self.token_cache is not None:
+                self.token_cache.store(key, token)
+
+    async def _refresh_token(self, rejected):
+        """
+        Replaces a token the API rejected. When another task already replaced it, its new token is used instead.
+        Returns True when a different token is available.
+        """
+        if self._auth_lock is None:
+            self._auth_lock = asyncio.Lock()
+        async with self._auth_lock:
+            current = self.headers.get("Authorization")
+            if current and current != rejected:
+                return True
+
+            self.headers.pop("Authorization", None)
+            if self.token_cache is not None:
+                key = TokenCache.key(self.api_url, self.username)
+                cached = self.token_cache.load(key)
+                if cached and f"Bearer {cached}" != rejected:
+                    self.headers["Authorization"] = f"Bearer {cached}"
+                    return True
+                self.token_cache.invalidate(key)
+
+            token = await self.authenticate()
+            if token and self.token_cache is not None:
+                self.token_cache.store(key, token)
+            return token is not None
+
+    async def authenticate(self):
+        """
+        Authenticates the user using admin credentials and updates the session headers with the token.
+        """
+
+        endpoint = "/api/users/authenticate"
+        url = urllib.parse.urljoin(self.api_url, endpoint)
+
+        payload = json.dumps({
+            "username": self.username,
+            "password": self.password
+        })
+        headers = {
+            "Content-Type": "application/json"
+        }
+
+        session = await self._get_session()
+        try:
+            async with session.post(url, headers=headers, data=payload) as response:
+                logging.info(f"Authentication response: {response.status}")
+                response.raise_for_status()
+
+                data = await response.json(content_type=None)
+                token = data.get("token")
+                if token:
+                    self.headers["Authorization"] = f"Bearer {token}"
+                    return token
+                else:
+                    logging.error(f"Authentication failed: {data}")
+                    return None
+
+        except json.JSONDecodeError:
+            logging.error("Failed to parse response: Invalid or unexpected JSON format")
+            return None
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logging.error(f"Request failed: {e!r}")
+            return None
+
+    async def request(self, endpoint, method="GET", payload=None, raw=False):
+        """
+        Performs an API request with the specified endpoint and method.
+        Read-only responses are served from the cache when one is configured,
+        and identical concurrent GET requests are merged when coalescing is enabled.
+
+        :param raw: (bool, default=False) Return the response body as bytes without decoding it; raw responses are never cached
+        """
+        ttl = self.cache.ttl(endpoint) if self.cache is not None and not raw else None
+        if ttl:
+            cached = self.cache.get(endpoint)
+            if self.metrics is not None:
+                self.metrics.increment("cache_hits" if cached is not None else "cache_misses", endpoint)
+            if cached is not None:
+                return cached
+            generation = self.cache.generation(endpoint)
+
+        if self.hedge is not None and method.upper() == "GET":
+            send = lambda: self._hedged_send(endpoint, method, payload, raw)
+        else:
+            send = lambda: self._send(endpoint, method, payload, raw)
+
+        if self.single_flight is not None and method.upper() != "POST":
+            result = await self.single_flight.do((endpoint, raw), send)
+        else:
+            result = await send()
+
+        if self.cache is not None:
+            if ttl:
+                if result["status"] is not None:
+                    self.cache.set(endpoint, result, ttl, generation)
+            elif method.upper() == "POST":
+                # Writes change the state of the addresses they touch, so drop their cached reads
+                self.cache.invalidate_write(endpoint, payload)
+
+        return result
+
+    async def _attempt(self, method, endpoint, data=None, headers=None, stream=False):
+        """
+        Sends a request until it gets an answer that is not retried.
+        Every attempt asks the circuit breaker, the rate limiter and the load balancer first and reports its outcome to them.
+        A rejected token is refreshed and the request replayed once, and idempotent requests are retried with backoff
+        after connection errors, timeouts and transient server errors. Retried attempts are recorded in the metrics;
+        the caller records the final one.
+
+        :param data: (bytes, optional) Encoded JSON payload of a POST request
+        :param headers: (dict, optional) Extra request headers
+        :param stream: (bool, default=False) Return once the headers arrive instead of reading the body first
+        :return: `(response, start)`, or None when the circuit of the endpoint is open; the caller releases the response
+        :raises aiohttp.ClientError: or asyncio.TimeoutError when the last attempt got no answer
+        """
+        # Authenticate if no token is present in the session headers
+        if not self.headers.get("Authorization"):
+            await self._ensure_authenticated()
+
+        balancer = self.load_balancer if self.load_balancer is not None and is_read_endpoint(method, endpoint) else None
+        base_url = self.api_url
+        session = await self._get_session()
+        retry_policy = self.config.retry_policy
+        retries = retry_policy.retries_for(method, endpoint)
+        attempt = 0
+        reauthenticated = False
+        metrics = self.metrics
+        breaker = self.circuit_breaker
+        limiter = self.rate_limiter.limiter(endpoint) if self.rate_limiter is not None else None
+        bytes_sent = len(data or b"")
+
+        while True:
+            if breaker is not None and not breaker.allow(endpoint):
+                # The endpoint keeps failing; fail fast instead of adding to the pile-up
+                if metrics is not None:
+                    metrics.increment("circuit_open", endpoint)
+                if logging.root.isEnabledFor(logging.DEBUG):
+                    logging.debug(f"Circuit for {endpoint} is open. Failing fast.")
+                return None
+            if limiter is not None and await limiter.acquire_async() and metrics is not None:
+                metrics.increment("rate_limited", endpoint)
+            if balancer is not None:
+                # A retry goes to another instance when one is available
+                base_url = balancer.acquire(exclude=(base_url,) if attempt else ())
+            url = urllib.parse.urljoin(base_url, endpoint)
+            authorization = self.headers.get("Authorization")
+            request_headers = {**self.headers, **headers} if headers else self.headers
+            start = time.perf_counter()
+            released = False
+            body = None
+            try:
+                if method.upper() == "POST":
+                    response = await session.post(url, data=data, headers=request_headers)
+                else:
+                    response = await session.get(url, headers=request_headers)
+                # The limiter and balancer see the time until the headers
+                released = True
+                self._release(endpoint, limiter, balancer, base_url, start, response.status)
+                if not stream:
+                    try:
+                        body = await response.read()
+                    except BaseException:
+                        response.release()
+                        raise
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if not released:
+                    self._release(endpoint, limiter, balancer, base_url, start, None)
+                if metrics is not None:
+                    metrics.record_request(method, endpoint, None, time.perf_counter() - start, bytes_sent=bytes_sent)
+                if attempt < retries and isinstance(e, (aiohttp.ClientConnectionError, asyncio.TimeoutError)):
+                    delay = retry_policy.delay(attempt)
+                    logging.warning(f"Request to {endpoint} failed: {e!r}. Retrying in {delay:.2f} seconds.")
+                    if metrics is not None:
+                        metrics.increment("retries", endpoint)
+                    await asyncio.sleep(delay)
+                    attempt += 1
+                    continue
+                raise
+            except BaseException:
+                # Cancelled before the response arrived, e.g. the slower copy of a hedged request
+                if not released:
+                    if limiter is not None:
+                        limiter.cancel()
+                    if balancer is not None:
+                        balancer.cancel(base_url)
+                raise
+
+            if response.status == 401 and not reauthenticated:
+                # The token expired or was revoked; a rejected request was not processed, so it is safe to replay
+                reauthenticated = True
+                response.release()
+                if await self._refresh_token(authorization):
+                    if metrics is not None:
+                        metrics.record_request(method, endpoint, 401, time.perf_counter() - start, 0.0, bytes_sent,
+                                               _wire_size(response), len(body or b""))
+                        metrics.increment("token_refreshes", endpoint)
+                    continue
+            elif response.status in retry_policy.retry_statuses and attempt < retries:
+                delay = retry_policy.delay(attempt, response.headers.get("Retry-After"))
+                logging.warning(f"API Response ({method} {endpoint}): {response.status}. Retrying in {delay:.2f} seconds.")
+                response.release()
+                if metrics is not None:
+                    metrics.record_request(method, endpoint, response.status, time.perf_counter() - start, 0.0, bytes_sent,
+                                           _wire_size(response), len(body or b""))
+                    metrics.increment("retries", endpoint)
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            return response, start
+
+    async def _send(self, endpoint, method="GET", payload=None, raw=False):
+        """
+        Sends a single API request.
+        This method builds the full URL, sends the request,
+        and handles the response (including error handling and JSON decoding).
+        A rejected token is refreshed and the request replayed once, and idempotent requests
+        are retried with backoff after connection errors and transient server errors.
+        """
+        metrics = self.metrics
+        data_sent = self.json_codec.dumps(payload) if method.upper() == "POST" and payload is not None else None
+        conditional = self.conditional if method.upper() != "POST" else None
+        stored = conditional.get((endpoint, raw)) if conditional is not None else None
+        if data_sent is not None:
+            headers = JSON_HEADERS
+        else:
+            headers = conditional.headers(stored) if stored is not None else None
+
+        try:
+            answer = await self._attempt(method, endpoint, data_sent, headers)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logging.error(f"Request to {endpoint} failed: {e!r}")
+            return {"status": None, "data": None}
+        if answer is None:
+            return {"status": None, "data": None}
+        response, start = answer
+
+        async with response:
+            if logging.root.isEnabledFor(logging.DEBUG):
+                logging.debug(f"API Response ({method} {endpoint}): {response.status}")
+            if response.status >= 400:
+                if metrics is not None:
+                    metrics.record_request(method, endpoint, response.status, time.perf_counter() - start,
+                                           bytes_sent=len(data_sent or b""))
+                logging.error(f"Request to {endpoint} failed: {response.status}, message={response.reason!r}")
+                return {"status": None, "data": None}
+
+            if metrics is not None and response.headers.get("Content-Encoding"):
+                metrics.increment("compressed", endpoint)
+
+            if stored is not None:
+                conditional.record(response.status == 304)
+                if response.status == 304:
+                    # Not modified: the stored body is still current and was neither downloaded nor decoded again
+                    if metrics is not None:
+                        metrics.record_request(method, endpoint, 304, time.perf_counter() - start)
+                        metrics.increment("not_modified", endpoint)
+                    return {"status": 200, "data": stored[2]}
+
+            body = await response.read()
+            latency = time.perf_counter() - start
+            decode_time = 0.0
+            if raw:
+                data = body
+            else:
+                decode_start = time.perf_counter()
+                try:
+                    data = self.json_codec.loads(body)
+                except ValueError:
+                    logging.warning(f"Response from {endpoint} is not JSON. Returning raw text.")
+                    data = body.decode(response.get_encoding(), errors="replace")
+                decode_time = time.perf_counter() - decode_start
+
+            if conditional is not None and response.status == 200:
+                conditional.set((endpoint, raw), response.headers.get("ETag"), response.headers.get("Last-Modified"), data,
+                                len(body))
+            if metrics is not None:
+                metrics.record_request(method, endpoint, response.status, latency, decode_time,
+                                       len(data_sent or b""), _wire_size(response), len(body))
+            return {"status": response.status, "data": data}
+
+    async def _hedged_send(self, endpoint, method="GET", payload=None, raw=False):
+        """
+        Sends an idempotent request and, when it has not been answered within the hedge delay of its endpoint,
+        a duplicate. The first successful answer is returned and the other request is cancelled.
+        """
+        hedge = self.hedge
+
+        async def send():
+            start = time.perf_counter()
+            result = await self._send(endpoint, method, payload, raw)
+            if result["status"] is not None:
+                hedge.record(endpoint, time.perf_counter() - start)
+            return result
+
+        delay = hedge.delay(endpoint)
+        if delay is None:
+            return await send()
+
+        first = asyncio.ensure_future(send())
+        pending = {first}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if done or not hedge.try_hedge():
+                return await first
+
+            if self.metrics is not None:
+                self.metrics.increment("hedges", endpoint)
+            pending.add(asyncio.ensure_future(send()))
+            result = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    result = task.result()
+                    if result["status"] is not None:
+                        return result
+            return result
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _release(self, endpoint, limiter, balancer, base_url, start, status):
+        """Reports the outcome of one HTTP attempt to the rate limiter, the load balancer and the circuit breaker"""
+        latency = time.perf_counter() - start
+        if limiter is not None:
+            limiter.release(latency, status)
+        if balancer is not None:
+            balancer.release(base_url, latency, status)
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record(endpoint, status)
+
+    async def map_addresses(self, func, addresses, max_concurrency=100, ordered=True):
+        """
+        Awaits `func(address)` for every address with bounded concurrency and yields `(address, result)` pairs.
+        At most `max_concurrency` requests are in flight, and a failure only affects the result of its own address.
+
+        :param ordered: (bool, default=True) Yield results in input order, otherwise as each one completes
+        """
+        if not isinstance(max_concurrency, int):
+            raise TypeError(f"max_concurrency must be an integer, got {type(max_concurrency).__name__}")
+
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        async def call(address):
+            try:
+                return await func(address)
+            except Exception as e:
+                logging.error(f"Request for {address} failed: {e}")
+                return {"status": None, "data": None}
+
+        addresses = iter(addresses)
+        pending = deque() if ordered else {}
+
+        def submit_next():
+            for address in addresses:
+                task = asyncio.ensure_future(call(address))
+                if ordered:
+                    pending.append((address, task))
+                else:
+                    pending[task] = address
+                return True
+            return False
+
+        try:
+            while len(pending) < max_concurrency and submit_next():
+                pass
+
+            while pending:
+                if ordered:
+                    address, task = pending.popleft()
+                    result = await task
+                    submit_next()
+                    yield address, result
+                else:
+                    done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        submit_next()
+                        yield pending.pop(task), task.result()
+        finally:
+            tasks = pending if not ordered else [task for _, task in pending]
+            for task in tasks:
+                task.cancel()
+
+    async def _iter_pages(self, fetch, name, address, pageSize):
+        """
+        Yields the blocks of every page returned by `fetch`, one block at a time.
+        The next page is requested in a background task while the caller works through the current one,
+        so at most two pages are held in memory.
+        """
+        pageIndex = 0
+        task = asyncio.ensure_future(fetch(address, pageIndex=pageIndex, pageSize=pageSize))
+        try:
+            while task is not None:
+                result = await task
+                if result.get("status") != 200:
+                    raise ZenonWalletAPIError(f"/api/ledger/{address}/{name}?pageIndex={pageIndex}", result)
+
+                data = result.get("data") or {}
+                blocks = data.get("list") or []
+                more = data.get("more", len(blocks) == pageSize)
+                del result, data
+
+                pageIndex += 1
+                task = asyncio.ensure_future(fetch(address, pageIndex=pageIndex, pageSize=pageSize)) if more and blocks else None
+                for block in blocks:
+                    yield block
+        finally:
+            if task is not None:
+                task.cancel()
+
+    async def _stream_list(self, endpoint, info):
+        """
+        Sends a GET request and yields the items of the `list` member while the body is still arriving,
+        so only one item is decoded at a time. The other members are stored in `info`.
+        Until the body is consumed nothing has been yielded, so the request is retried like any other GET.
+        """
+        try:
+            answer = await self._attempt("GET", endpoint, stream=True)
+            if answer is None:
+                raise ZenonWalletAPIError(endpoint, {"status": None, "data": None})
+            response, _ = answer
+
+            async with response:
+                if logging.root.isEnabledFor(logging.DEBUG):
+                    logging.debug(f"API Response (GET {endpoint}): {response.status}")
+                if response.status != 200:
+                    raise ZenonWalletAPIError(endpoint, {"status": response.status, "data": None})
+
+                # Network and decode time interleave while streaming, so the whole transfer counts as latency
+                start = time.perf_counter()
+                received = 0
+                stream = JsonArrayStream()
+                try:
+                    async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+                        received += len(chunk)
+                        for item in stream.feed(chunk):
+                            yield item
+                    for item in stream.close():
+                        yield item
+                    info.update(stream.info)
+                finally:
+                    if self.metrics is not None:
+                        self.metrics.record_request("GET", endpoint, response.status, time.perf_counter() - start,
+                                                    bytes_received=_wire_size(response), bytes_decoded=received)
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logging.error(f"Request to {endpoint} failed: {e}")
+            raise ZenonWalletAPIError(endpoint, {"status": None, "data": None}) from e
+        except ValueError as e:
+            logging.error(f"Response from {endpoint} is not a valid block list: {e}")
+            raise ZenonWalletAPIError(endpoint, {"status": 200, "data": None}) from e
+
+    async def _iter_streamed_pages(self, name, address, pageSize):
+        """
+        Yields the blocks of every page one at a time, decoding each page incrementally from the socket.
+        Pages are requested one after another, so memory stays bounded by a single block.
+        """
+        if not isinstance(pageSize, int):
+            raise TypeError(f"pageSize must be an integer, got {type(pageSize).__name__}")
+
+        if not (1 <= pageSize <= PAGE_SIZE_LIMITS[name]):
+            raise ValueError(f"pageSize must be between 1 and {PAGE_SIZE_LIMITS[name]}")
+
+        pageIndex = 0
+        while True:
+            info = {}
+            count = 0
+            async for block in self._stream_list(f"/api/ledger/{address}/{name}?pageIndex={pageIndex}&pageSize={pageSize}", info):
+                count += 1
+                yield block
+
+            if not count or not info.get("more", count == pageSize):
+                return
+            pageIndex += 1
+
+    # Specific API methods
+
+    # AutoReceiver
+    async def get_autoreceiver_status(self):
+        """Get the auto-receiver status"""
+        return await self.request(f"/api/auto-receiver/status")
+
+    # Plasma
+    async def generate_plasma_qsr(self, address):
+        """Generate plasma by fusing QSR from wallet address"""
+        return await self.request(f"/api/plasma/{address}/fuse", method="POST")
+
+    async def cancel_plasma_fusion(self, address, idHash): # Untested
+        """Send requests to cancel plasma fusion from wallet address"""
+        return await self.request(f"/api/plasma/{address}/cancel", method="POST", payload={"idHash": idHash})
+
+    # Ledger
+    async def ledger_account_info(self, address):
+        """Get the account info by address"""
+        return await self.request(f"/api/ledger/{address}/balances")
+
+    def ledger_account_info_many(self, addresses, max_concurrency=100, ordered=True):
+        """
+        Get the account info for many addresses concurrently
+
+        :param addresses: (iterable of str, required)
+        :param max_concurrency: (int, default=100) Maximum number of requests in flight
+        :param ordered: (bool, default=True) Yield in input order, otherwise as each request completes
+        :return: async generator of `(address, result)` pairs
+        """
+        return self.map_addresses(self.ledger_account_info, addresses, max_concurrency, ordered)
+
+    async def ledger_received_account_blocks(self, address, **kwargs):
+        """
+        Get all received account blocks by address
+
+        :param address: (str, required)
+        :param pageIndex: (int, default=0)
+        :param pageSize: (int, default=1024, must be between 1 and 1024 inclusive)
+        :param raw: (bool, default=False) Return the undecoded response body as bytes
+        """
+        pageIndex = kwargs.get('pageIndex', 0)
+        pageSize = kwargs.get('pageSize', 1024)
+        raw = kwargs.get('raw', False)
+
+        if not isinstance(pageIndex, int):
+            raise TypeError(f"pageIndex must be an integer, got {type(pageIndex).__name__}")
+
+        if not isinstance(pageSize, int):
+            raise TypeError(f"pageSize must be an integer, got {type(pageSize).__name__}")
+
+        if not (1 <= pageSize <= 1024):
+            raise ValueError("pageSize must be between 1 and 1024")
+
+        return await self.request(f"/api/ledger/{address}/received?pageIndex={pageIndex}&pageSize={pageSize}", raw=raw)
+
+    async def ledger_unreceived_account_blocks(self, address, **kwargs):
+        """
+        Get all unreceived account blocks by address
+
+        :param address: (str, required)
+        :param pageIndex: (int, default=0)
+        :param pageSize: (int, default=50, must be between 1 and 50 inclusive)
+        :param raw: (bool, default=False) Return the undecoded response body as bytes
+        """
+        pageIndex = kwargs.get('pageIndex', 0)
+        pageSize = kwargs.get('pageSize', 50)
+        raw = kwargs.get('raw', False)
+
+        if not isinstance(pageIndex, int):
+            raise TypeError(f"pageIndex must be an integer, got {type(pageIndex).__name__}")
+
+        if not isinstance(pageSize, int):
+            raise TypeError(f"pageSize must be an integer, got {type(pageSize).__name__}")
+
+        if not (1 <= pageSize <= 50):
+            raise ValueError("pageSize must be between 1 and 50")
+
+        return await self.request(f"/api/ledger/{address}/unreceived?pageIndex={pageIndex}&pageSize={pageSize}", raw=raw)
+
+    def iter_received_blocks(self, address, pageSize=1024, stream=False):
+        """
+        Iterate over all received account blocks by address, fetching the next page in the background
+
+        :param address: (str, required)
+        :param pageSize: (int, default=1024, must be between 1 and 1024 inclusive)
+        :param stream: (bool, default=False) Decode each page incrementally while it downloads instead of prefetching
+                       whole pages, so memory is bounded by a single block
+        :raises ZenonWalletAPIError: when a page request fails
+        """
+        if stream:
+            return self._iter_streamed_pages("received", address, pageSize)
+        return self._iter_pages(self.ledger_received_account_blocks, "received", address, pageSize)
+
+    def iter_unreceived_blocks(self, address, pageSize=50, stream=False):
+        """
+        Iterate over all unreceived account blocks by address, fetching the next page in the background
+
+        :param address: (str, required)
+        :param pageSize: (int, default=50, must be between 1 and 50 inclusive)
+        :param stream: (bool, default=False) Decode each page incrementally while it downloads instead of prefetching
+                       whole pages, so memory is bounded by a single block
+        :raises ZenonWalletAPIError: when a page request fails
+        """
+        if stream:
+            return self._iter_streamed_pages("unreceived", address, pageSize)
+        return self._iter_pages(self.ledger_unreceived_account_blocks, "unreceived", address, pageSize)
+
+    async def ledger_plasma_info(self, address):
+        """Retrieves plasma information for the wallet address."""
+        return await self.request(f"/api/ledger/{address}/plasma")
+
+    def ledger_plasma_info_many(self, addresses, max_concurrency=100, ordered=True):
+        """
+        Retrieves plasma information for many addresses concurrently
+
+        :param addresses: (iterable of str, required)
+        :param max_concurrency: (int, default=100) Maximum number of requests in flight
+        :param ordered: (bool, default=True) Yield in input order, otherwise as each request completes
+        :return: async generator of `(address, result)` pairs
+        """
+        return self.map_addresses(self.ledger_plasma_info, addresses, max_concurrency, ordered)
+
+    async def ledger_fusion_entries(self, address):
+        """Get all fusion entries by address"""
+        return await self.request(f"/api/ledger/{address}/fused")
+
+    # Transfer
+    async def send_tokens(self, **kwargs):
+        """
+        Send tokens to an wallet address
+        :param sender: (str, optional) Defaults to the wallet's primary address
+        :param receiver: (str, required) The recipient address
+        :param amount: (str, optional) The amount to send; default is "0.00000001" and must be a valid float >= 0.00000001
+        :param tokenStandard: (str, optional) Defaults to "ZNN"
+        """
+        sender_address = kwargs.get("sender", self.address)
+        receiver_address = kwargs.get("receiver")
+        amount = kwargs.get("amount", "0.00000001")
+        tokenStandard = kwargs.get("tokenStandard", "ZNN")
+
+        if not isinstance(amount, str):
+            raise TypeError(f"amount must be a string, got {type(amount).__name__}")
+
+        try:
+            parsed_amount = float(amount)
+        except ValueError:
+            raise ValueError(f"amount must be a valid numeric string, got '{amount}'")
+
+        if parsed_amount < 0.00000001:
+            raise ValueError("amount must be at least 0.00000001")
+
+        if not receiver_address:
+            raise ValueError("receiver is required and must be a valid address")
+
+        return await self.request(f"/api/transfer/{sender_address}/send", method="POST", payload={"address": receiver_address, "amount": amount, "tokenStandard": tokenStandard})
+
+    async def receive_account_block(self, address, blockHash):
+        """
+        Receive an account block by block hash
+        Requires Wallet to be initialized and unlocked
+        `blockHash` can be received from `ledger_unreceived_account_blocks`. Only needed when auto-receiver is disabled
+        """
+        return await self.request(f"/api/transfer/{address}/receive", method="POST", payload={"blockHash": blockHash})
+
+    # Wallet
+    async def wallet_status(self):
+        """Retrieves the wallet status."""
+        return await self.request("/api/wallet/status")
+
+    async def wallet_accounts(self):
+        """Retrieves the list of wallet accounts."""
+        return await self.request("/api/wallet/accounts")
+
+    async def wallet_add_accounts(self):
+        """Add new accounts to wallet."""
+        return await self.request("/api/wallet/accounts", method="POST")
+
+    async def wallet_initialize(self):
+        """Sends a request to initialize a new wallet"""
+        return await self.request("/api/wallet/init", method="POST", payload={"password": self.secret})
+
+    async def wallet_restore(self):
+        """Sends a request to restore an existing wallet"""
+        return await self.request("/api/wallet/restore", method="POST", payload={"password": self.secret, "mnemonic": self.mnemonic})
+
+    async def wallet_lock(self):
+        """Sends a request to lock the wallet"""
+        return await self.request("/api/wallet/lock", method="POST")
+
+    async def wallet_unlock(self):
+        """Sends a request to unlock the wallet."""
+        return await self.request("/api/wallet/unlock", method="POST", payload={"password": self.secret})
+
+    # Utilities
+    async def generate_plasma_bot(self, address):
+        """Generate plasma by fusing QSR from the plasma-bot"""
+        return await self.request("/api/utilities/plasma-bot/fuse", method="POST", payload={"address": address})
+
+    async def fusion_expiration(self, address):
+        """Get the fusion expiration by address from the plasma-bot"""
+        return await self.request(f"/api/utilities/plasma-bot/expiration/{address}")
+
+    async def validate_address(self, address):
+        """Validate an wallet address"""
+        return await self.request(f"/api/utilities/address/validate?address={address}", method="POST")
+
+    def validate_addresses(self, addresses, remote=False, max_concurrency=100, ordered=True):
+        """
+        Validate many wallet addresses
+        Addresses are checked locally (bech32 format and checksum) without any network call,
+        and each result is `{"status": 200, "data": valid}`.
+
+        :param addresses: (iterable of str, required)
+        :param remote: (bool, default=False) Ask the server endpoint instead, `max_concurrency` requests at a time
+        :param ordered: (bool, default=True) With `remote=True`, yield in input order, otherwise as each request completes
+        :return: async generator of `(address, result)` pairs, like the other `*_many` methods
+        """
+        if remote:
+            return self.map_addresses(self.validate_address, addresses, max_concurrency, ordered)
+
+        async def check():
+            for address in addresses:
+                yield address, {"status": 200, "data": is_valid_address(address)}
+
+        return check()
+
+    # Close
+    async def close(self):
+        """Closes the session."""
+        if self.session is not None:
+            await self.session.close()
@@ -0,0 +1,108 @@
+import logging
+import threading
+from decimal import Decimal
+
+class TokenInfo:
+    """Token metadata, interned once per token standard"""
+
+    __slots__ = ("tokenStandard", "name", "symbol", "decimals")
+
+    def __init__(self, tokenStandard, name, symbol, decimals):
+        self.tokenStandard = tokenStandard
+        self.name = name
+        self.symbol = symbol
+        self.decimals = decimals
+
+    def __repr__(self):
+        return f"TokenInfo({self.tokenStandard!r}, {self.symbol!r}, decimals={self.decimals})"
+
+class TokenBalance:
+    """Balance of one token, kept as the raw integer amount so no precision is lost"""
+
+    __slots__ = ("token", "raw")
+
+    def __init__(self, token, raw):
+        self.token = token
+        self.raw = raw
+
+    @property
+    def amount(self):
+        """Exact balance as a Decimal"""
+        return Decimal(self.raw).scaleb(-self.token.decimals)
+
+    def format(self):
+        """Exact balance as a string with all decimals, e.g. "12.34000000" """
+        decimals = self.token.decimals
+        sign = "-" if self.raw < 0 else ""
+        whole, fraction = divmod(abs(self.raw), 10 ** decimals)
+        if not decimals:
+            return f"{sign}{whole}"
+        return f"{sign}{whole}.{fraction:0{decimals}d}"
+
+    def __repr__(self):
+        return f"TokenBalance({self.token.symbol} {self.format()})"
+
+_tokens = {}
+_tokens_lock = threading.Lock()
+
+def token_info(tokenStandard, token):
+    """Returns the interned TokenInfo for a token standard, creating it from the API metadata on first use"""
+    info = _tokens.get(tokenStandard)
+    decimals = int(token["decimals"])
+    if info is None or info.decimals != decimals or info.name != token["name"] or info.symbol != token["symbol"]:
+        with _tokens_lock:
+            info = _tokens[tokenStandard] = TokenInfo(tokenStandard, token["name"], token["symbol"], decimals)
+    return info
+
+def parse_balances(data):
+    """
+    Converts the `data` of `ledger_account_info` into TokenBalance records
+
+    :param data: (dict, required) Account info with a `balanceInfoMap`
+    :return: list of TokenBalance
+    """
+    balances = []
+    for tokenStandard, info in (data.get("balanceInfoMap") or {}).items():
+        balances.append(TokenBalance(token_info(tokenStandard, info["token"]), int(info["balance"])))
+    return balances
+
+def get_balances(client, address):
+    """
+    Get the balances of an address
+
+    :return: list of TokenBalance, or None when the API call failed
+    """
+    ledger_account_info = client.ledger_account_info(address)
+    if ledger_account_info.get("status") != 200:
+        logging.error(f"API call failed: {ledger_account_info.get('status')}")
+        return None
+    return parse_balances(ledger_account_info.get("data"))
+
+def get_balances_many(client, addresses, max_concurrency=10, ordered=True):
+    """
+    Get the balances of many addresses concurrently, converting each response as soon as it arrives
+
+    :return: generator of `(address, balances)` pairs; balances is None when the API call failed
+    """
+    for address, ledger_account_info in client.ledger_account_info_many(addresses, max_concurrency, ordered):
+        if ledger_account_info.get("status") != 200:
+            yield address, None
+        else:
+            yield address, parse_balances(ledger_account_info.get("data"))
+
+def total_balances(balances_by_address):
+    """
+    Adds up the raw amounts per token standard
+
+    :param balances_by_address: (iterable) `(address, balances)` pairs as returned by `get_balances_many`
+    :return: dict of token standard to TokenBalance
+    """
+    totals = {}
+    for _, balances in balances_by_address:
+        for balance in balances or ():
+            total = totals.get(balance.token.tokenStandard)
+            if total is None:
+                totals[balance.token.tokenStandard] = TokenBalance(balance.token, balance.raw)
+            else:
+                total.raw += balance.raw
+    return totals
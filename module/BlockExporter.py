@@ -0,0 +1,252 @@
+import csv
+import logging
+import os
+from .AddressValidator import is_valid_address
+from .ZenonWalletClient import ZenonWalletAPIError
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:  # pyarrow is only needed for Parquet and Arrow output
+    pyarrow = None
+
+COLUMNS = ("address", "height", "hash", "tokenStandard", "amount", "timestamp")
+FORMATS = {".csv": "csv", ".parquet": "parquet", ".arrow": "arrow", ".feather": "arrow"}
+# Client errors that repeat on every attempt and only concern one address; auth and rate-limit answers are not among them
+SKIPPED_STATUSES = frozenset(range(400, 500)) - {401, 403, 408, 429}
+
+class BlockExportError(ZenonWalletAPIError):
+    """
+    Raised by `export_blocks` when a page request still fails after the client's retries.
+    Every page before `pageIndex` of `address` was written, so the export can be resumed from there.
+    """
+
+    def __init__(self, endpoint, result, address, pageIndex, partial=None):
+        super().__init__(endpoint, result)
+        self.address = address
+        self.pageIndex = pageIndex
+        self.partial = partial
+        output = f"kept in {partial}" if partial else "written to the output"
+        self.args = (f"{self.args[0]}. The blocks before page {pageIndex} of {address} were {output}; "
+                     f"resume with from_address={address!r}, pageIndex={pageIndex} and resume=True",)
+
+def block_row(address, block):
+    """
+    Flattens a received account block into a row of COLUMNS.
+    The amount stays the raw integer as a string, since token amounts can exceed 64 bits.
+    """
+    confirmation = block.get("confirmationDetail") or {}
+    amount = block.get("amount")
+    return (
+        address,
+        block["height"],
+        block["hash"],
+        block.get("tokenStandard"),
+        str(amount) if amount is not None else None,
+        confirmation.get("momentumTimestamp"),
+    )
+
+class CsvBlockWriter:
+
+    def __init__(self, file, append=False):
+        """
+        Writes block rows as CSV with a header line
+
+        :param file: (str or file object, required) Path, or a text file opened with newline=""
+        :param append: (bool, default=False) Add rows to an existing file at the path instead of replacing it;
+                       the header is only written when the file is empty
+        """
+        if isinstance(file, (str, os.PathLike)):
+            self.file = open(file, "a" if append else "w", newline="")
+        else:
+            self.file = file
+        self.owned = self.file is not file
+        self.writer = csv.writer(self.file)
+        if not (append and self.owned and self.file.tell()):
+            self.writer.writerow(COLUMNS)
+
+    def write(self, row):
+        self.writer.writerow(row)
+
+    def close(self):
+        if self.owned:
+            self.file.close()
+        else:
+            self.file.flush()
+
+class ColumnarBlockWriter:
+
+    def __init__(self, path, format="parquet", row_group_size=65536, compression="zstd", append=False):
+        """
+        Writes block rows to a Parquet or Arrow IPC file in row groups of `row_group_size` rows.
+        Only one row group is held in memory. Height is int64, timestamp a UTC timestamp in seconds,
+        and the other columns are strings; Parquet dictionary-encodes the repeated address and token columns.
+
+        :param path: (str, required)
+        :param format: (str, default="parquet") "parquet" or "arrow"
+        :param row_group_size: (int, default=65536) Rows per row group or record batch
+        :param compression: (str, default="zstd") Parquet compression codec
+        :param append: (bool, default=False) Keep the rows of an existing file at the path. Parquet and Arrow files
+                       cannot be reopened for writing, so they are copied into the new file one batch at a time
+        """
+        if pyarrow is None:
+            raise ImportError("Parquet and Arrow export requires pyarrow (pip install pyarrow)")
+
+        if format not in ("parquet", "arrow"):
+            raise ValueError(f"format must be 'parquet' or 'arrow', got {format!r}")
+
+        if row_group_size < 1:
+            raise ValueError("row_group_size must be at least 1")
+
+        self.schema = pyarrow.schema([
+            ("address", pyarrow.string()),
+            ("height", pyarrow.int64()),
+            ("hash", pyarrow.string()),
+            ("tokenStandard", pyarrow.string()),
+            ("amount", pyarrow.string()),
+            ("timestamp", pyarrow.timestamp("s", tz="UTC")),
+        ])
+        self.row_group_size = row_group_size
+        previous = None
+        if append and os.path.exists(path):
+            previous = f"{os.fspath(path)}.previous"
+            os.replace(path, previous)
+        if format == "parquet":
+            self.writer = pyarrow.parquet.ParquetWriter(path, self.schema, compression=compression)
+        else:
+            self.writer = pyarrow.ipc.new_file(path, self.schema)
+        self.columns = tuple([] for _ in COLUMNS)
+
+        if previous is not None:
+            if format == "parquet":
+                batches = pyarrow.parquet.ParquetFile(previous).iter_batches(batch_size=row_group_size)
+            else:
+                reader = pyarrow.ipc.open_file(previous)
+                batches = (reader.get_batch(i) for i in range(reader.num_record_batches))
+            for batch in batches:
+                # Parquet reads second timestamps back as milliseconds
+                self.writer.write_table(pyarrow.Table.from_batches([batch]).cast(self.schema))
+            os.remove(previous)
+
+    def write(self, row):
+        for column, value in zip(self.columns, row):
+            column.append(value)
+        if len(self.columns[0]) >= self.row_group_size:
+            self.flush()
+
+    def flush(self):
+        """Writes the buffered rows as one row group"""
+        if not self.columns[0]:
+            return
+        arrays = [pyarrow.array(column, type=field.type) for column, field in zip(self.columns, self.schema)]
+        self.writer.write_batch(pyarrow.record_batch(arrays, schema=self.schema))
+        for column in self.columns:
+            column.clear()
+
+    def close(self):
+        self.flush()
+        self.writer.close()
+
+def output_format(path):
+    """Returns the export format for a path from its file extension; file objects and unknown extensions are CSV"""
+    if not isinstance(path, (str, os.PathLike)):
+        return "csv"
+    return FORMATS.get(os.path.splitext(os.fspath(path))[1].lower(), "csv")
+
+def open_writer(path, format=None, row_group_size=65536, append=False):
+    """
+    Returns a block writer for a path; the format is taken from the file extension when not given
+
+    :param format: (str, optional) "csv", "parquet" or "arrow"
+    :param append: (bool, default=False) Keep the rows of an existing file at the path
+    """
+    if format is None:
+        format = output_format(path)
+    if format == "csv":
+        return CsvBlockWriter(path, append)
+    return ColumnarBlockWriter(path, format, row_group_size, append=append)
+
+def export_blocks(client, addresses, path, format=None, pageSize=1024, row_group_size=65536, pageIndex=0,
+                  resume=False, overwrite=False, from_address=None, errors=None):
+    """
+    Exports the full received-block history of one or many addresses into a CSV, Parquet or Arrow file.
+    Pages are requested one at a time through the client, so every page is retried by its retry policy,
+    and rows go straight to the writer, so memory stays bounded by a single page however long the histories are.
+    A file path is written as `<path>.partial` and only renamed to `path` once the export is complete.
+    The `.partial` file of a failed export is kept: `resume=True` adds to it, and it is never replaced silently.
+    Invalid addresses and addresses the server rejects with a client error are skipped instead of stopping the export.
+
+    :param addresses: (str or iterable of str, required)
+    :param path: (str or file object, required) Output file; file objects are written as CSV
+    :param format: (str, optional) "csv", "parquet" or "arrow"; defaults to the file extension
+    :param pageSize: (int, default=1024, must be between 1 and 1024 inclusive)
+    :param row_group_size: (int, default=65536) Rows per row group of columnar files
+    :param pageIndex: (int, default=0) Page to start the first exported address at, e.g. to resume an interrupted export
+    :param resume: (bool, default=False) Keep the rows of an existing `<path>.partial` and add the new ones after them
+    :param overwrite: (bool, default=False) Replace an existing `<path>.partial` instead of refusing to start
+    :param from_address: (str, optional) Skip the addresses before this one, e.g. to resume an interrupted export
+    :param errors: (dict, optional) Receives `{address: reason}` for every skipped address; the reason is
+                   "invalid address" or the HTTP status
+    :return: (int) Number of blocks exported by this call
+    :raises BlockExportError: when a page request still fails after the retries; it names the address and page
+                              to resume from, and a file path is left as `<path>.partial`
+    :raises FileExistsError: when `<path>.partial` exists and neither `resume` nor `overwrite` is set
+    :raises ValueError: when `from_address` is not among the addresses
+    """
+    if isinstance(addresses, str):
+        addresses = [addresses]
+
+    if isinstance(path, (str, os.PathLike)):
+        format = format or output_format(path)
+        partial = f"{os.fspath(path)}.partial"
+        if not resume and not overwrite and os.path.exists(partial):
+            raise FileExistsError(f"{partial} is left from an interrupted export; resume it or overwrite it")
+    else:
+        partial = None
+
+    writer = open_writer(partial or path, format, row_group_size, append=resume)
+    errors = errors if errors is not None else {}
+    started = from_address is None
+    count = 0
+    try:
+        for address in addresses:
+            if not started:
+                if address != from_address:
+                    continue
+                started = True
+
+            if not is_valid_address(address):
+                logging.warning(f"Skipping {address}: invalid address")
+                errors[address] = "invalid address"
+                continue
+
+            while True:
+                result = client.ledger_received_account_blocks(address, pageIndex=pageIndex, pageSize=pageSize)
+                status = result.get("status")
+                if status in SKIPPED_STATUSES:
+                    logging.warning(f"Skipping {address}: page {pageIndex} failed with {status}")
+                    errors[address] = status
+                    break
+                if status != 200:
+                    raise BlockExportError(f"/api/ledger/{address}/received?pageIndex={pageIndex}", result,
+                                           address, pageIndex, partial)
+
+                data = result.get("data") or {}
+                blocks = data.get("list") or []
+                for block in blocks:
+                    writer.write(block_row(address, block))
+                count += len(blocks)
+                if not blocks or not data.get("more", len(blocks) == pageSize):
+                    break
+                pageIndex += 1
+            pageIndex = 0
+    finally:
+        writer.close()
+
+    if not started:
+        raise ValueError(f"{from_address} is not among the addresses to export")
+
+    if partial is not None:
+        os.replace(partial, path)
+    return count
@@ -0,0 +1,150 @@
+import json
+import logging
+import sqlite3
+import threading
+
+class BlockIndex:
+
+    def __init__(self, client, path="block_index.sqlite3"):
+        """
+        Local SQLite index of received account blocks.
+        Each address keeps a height/hash watermark, so `sync` only downloads the blocks received since the last run.
+
+        :param client: (ZenonWalletClient, required)
+        :param path: (str, default="block_index.sqlite3") Location of the SQLite database file
+        """
+        self.client = client
+        self.path = path
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        with self.lock, self.connection:
+            self.connection.executescript("""
+                CREATE TABLE IF NOT EXISTS blocks (
+                    hash TEXT PRIMARY KEY,
+                    address TEXT NOT NULL,
+                    height INTEGER NOT NULL,
+                    token_standard TEXT,
+                    amount TEXT,
+                    timestamp INTEGER,
+                    data TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS blocks_address_height ON blocks (address, height);
+                CREATE INDEX IF NOT EXISTS blocks_address_token ON blocks (address, token_standard, height);
+                CREATE TABLE IF NOT EXISTS watermarks (
+                    address TEXT PRIMARY KEY,
+                    height INTEGER NOT NULL,
+                    hash TEXT NOT NULL
+                );
+            """)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def watermark(self, address):
+        """Returns the `(height, hash)` of the newest indexed block of an address, or None"""
+        with self.lock:
+            return self.connection.execute("SELECT height, hash FROM watermarks WHERE address = ?", (address,)).fetchone()
+
+    def _store(self, address, blocks):
+        rows = []
+        for block in blocks:
+            confirmation = block.get("confirmationDetail") or {}
+            amount = block.get("amount")
+            rows.append((
+                block["hash"],
+                address,
+                block["height"],
+                block.get("tokenStandard"),
+                str(amount) if amount is not None else None,
+                confirmation.get("momentumTimestamp"),
+                json.dumps(block),
+            ))
+        with self.lock, self.connection:
+            self.connection.executemany("INSERT OR IGNORE INTO blocks VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def sync(self, address, pageSize=1024):
+        """
+        Downloads the received account blocks newer than the watermark of an address and stores them.
+        Pages come newest first and are streamed without prefetching, so paging stops at the first block
+        that is already indexed and no page after it is requested.
+        The watermark only moves after every new block is stored; an interrupted sync is simply repeated next time.
+
+        :param address: (str, required)
+        :param pageSize: (int, default=1024, must be between 1 and 1024 inclusive)
+        :return: (int) Number of new blocks
+        :raises ZenonWalletAPIError: when a page request fails
+        """
+        watermark = self.watermark(address)
+        newest = None
+        batch = []
+        count = 0
+
+        blocks = self.client.iter_received_blocks(address, pageSize=pageSize, stream=True)
+        try:
+            for block in blocks:
+                if watermark and block["height"] <= watermark[0]:
+                    if block["height"] == watermark[0] and block["hash"] != watermark[1]:
+                        logging.warning(f"Block at height {watermark[0]} of {address} does not match the indexed hash")
+                    break
+                if newest is None:
+                    newest = (block["height"], block["hash"])
+                batch.append(block)
+                if len(batch) >= pageSize:
+                    self._store(address, batch)
+                    count += len(batch)
+                    batch = []
+        finally:
+            blocks.close()
+
+        if batch:
+            self._store(address, batch)
+            count += len(batch)
+
+        if newest is not None:
+            with self.lock, self.connection:
+                self.connection.execute("INSERT OR REPLACE INTO watermarks VALUES (?, ?, ?)", (address, newest[0], newest[1]))
+
+        logging.debug(f"Indexed {count} new blocks for {address}")
+        return count
+
+    def sync_many(self, addresses, max_concurrency=10, pageSize=1024):
+        """
+        Syncs many addresses concurrently
+
+        :return: generator of `(address, new_block_count)` pairs; the count is None when the sync failed
+        """
+        def sync(address):
+            try:
+                return self.sync(address, pageSize=pageSize)
+            except Exception as e:
+                logging.error(f"Failed to sync {address}: {e}")
+                return None
+
+        return self.client.map_addresses(sync, addresses, max_concurrency, ordered=False)
+
+    def _query(self, sql, parameters):
+        with self.lock:
+            rows = self.connection.execute(sql, parameters).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def get_block(self, blockHash):
+        """Returns the indexed block with the given hash, or None"""
+        blocks = self._query("SELECT data FROM blocks WHERE hash = ?", (blockHash,))
+        return blocks[0] if blocks else None
+
+    def blocks_by_height(self, address, start=0, end=None):
+        """Returns the indexed blocks of an address with `start <= height <= end`, oldest first"""
+        if end is None:
+            return self._query("SELECT data FROM blocks WHERE address = ? AND height >= ? ORDER BY height", (address, start))
+        return self._query("SELECT data FROM blocks WHERE address = ? AND height BETWEEN ? AND ? ORDER BY height", (address, start, end))
+
+    def blocks_by_token(self, address, tokenStandard):
+        """Returns the indexed blocks of an address for one token standard, oldest first"""
+        return self._query("SELECT data FROM blocks WHERE address = ? AND token_standard = ? ORDER BY height", (address, tokenStandard))
+
+    def close(self):
+        """Closes the database connection."""
+        self.connection.close()
@@ -0,0 +1,129 @@
+import logging
+import threading
+import time
+
+class BlockReceiver:
+
+    def __init__(self, client, addresses=None, max_concurrency=10, pageSize=50):
+        """
+        Client-side replacement for the auto-receiver: receives the unreceived blocks of many accounts in parallel.
+        The blocks of one account are received one after another in the order the API lists them.
+        Requires Wallet to be initialized and unlocked.
+
+        :param client: (ZenonWalletClient, required)
+        :param addresses: (list of str, optional) Accounts to drain; defaults to every account from `wallet_accounts()`
+        :param max_concurrency: (int, default=10) Maximum number of accounts drained at the same time
+        :param pageSize: (int, default=50, must be between 1 and 50 inclusive)
+        """
+        self.client = client
+        self.addresses = addresses
+        self.max_concurrency = max_concurrency
+        self.pageSize = pageSize
+
+        self.lock = threading.Lock()
+        self.started = time.monotonic()
+        self.received = 0
+        self.failed = 0
+        self.backlog = {}
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def accounts(self):
+        """Returns the addresses to drain"""
+        if self.addresses is not None:
+            return list(self.addresses)
+
+        wallet_accounts = self.client.wallet_accounts()
+        if wallet_accounts.get("status") != 200:
+            logging.error(f"API call failed: {wallet_accounts.get('status')}")
+            return []
+        return [account.get("address") for account in wallet_accounts.get("data", {}).get("list", [])]
+
+    def drain(self, addresses=None):
+        """
+        Receives every unreceived block of the accounts once.
+
+        :param addresses: (list of str, optional) Defaults to `accounts()`
+        :return: dict of address to the number of blocks received
+        """
+        addresses = addresses if addresses is not None else self.accounts()
+        return dict(self.client.map_addresses(self._drain_account, addresses, self.max_concurrency, ordered=False))
+
+    def _drain_account(self, address):
+        """
+        Receives the blocks of one account in order. Received blocks can stay listed for a while,
+        so hashes that were already submitted are skipped and the next page is read instead.
+        """
+        seen = set()
+        received = 0
+        pageIndex = 0
+
+        while not self.stop_event.is_set():
+            result = self.client.ledger_unreceived_account_blocks(address, pageIndex=pageIndex, pageSize=self.pageSize)
+            if result.get("status") != 200:
+                logging.error(f"API call failed for {address}: {result.get('status')}")
+                break
+
+            data = result.get("data") or {}
+            blocks = data.get("list") or []
+            if pageIndex == 0:
+                with self.lock:
+                    self.backlog[address] = data.get("count", len(blocks))
+
+            new_blocks = [block for block in blocks if block.get("hash") not in seen]
+            if not new_blocks:
+                if not blocks or not data.get("more", len(blocks) == self.pageSize):
+                    break
+                pageIndex += 1
+                continue
+
+            for block in new_blocks:
+                blockHash = block["hash"]
+                seen.add(blockHash)
+                receive_account_block = self.client.receive_account_block(address, blockHash)
+                with self.lock:
+                    if receive_account_block.get("status") == 200:
+                        self.received += 1
+                        self.backlog[address] = max(self.backlog.get(address, 1) - 1, 0)
+                    else:
+                        self.failed += 1
+                if receive_account_block.get("status") != 200:
+                    # Later blocks of this account wait for the next drain, to keep them in order
+                    logging.error(f"Failed to receive {blockHash} for {address}: {receive_account_block.get('status')}")
+                    return received
+                received += 1
+
+            # Received blocks leave the list, so start over from the first page
+            pageIndex = 0
+
+        return received
+
+    def stats(self):
+        """Returns the throughput counters and the backlog per account"""
+        with self.lock:
+            elapsed = time.monotonic() - self.started
+            return {
+                "received": self.received,
+                "failed": self.failed,
+                "elapsed": elapsed,
+                "blocks_per_second": self.received / elapsed if elapsed > 0 else 0.0,
+                "backlog": dict(self.backlog),
+            }
+
+    def run(self, interval=10):
+        """Drains the accounts every `interval` seconds until `stop()` is called"""
+        while not self.stop_event.is_set():
+            self.drain()
+            self.stop_event.wait(interval)
+
+    def start(self, interval=10):
+        """Runs the receiver loop on a background thread"""
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.run, args=(interval,), name="BlockReceiver", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """Stops the receiver loop after the blocks in progress"""
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join()
@@ -0,0 +1,89 @@
+import threading
+import time
+from .Metrics import endpoint_template
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+class CircuitBreaker:
+
+    def __init__(self, failure_threshold=5, reset_timeout=30, half_open_requests=1):
+        """
+        Fails requests fast while an endpoint is unhealthy instead of letting them pile up.
+        The circuit of an endpoint template opens after `failure_threshold` consecutive failures
+        (connection errors, timeouts, 429 and 5xx responses). After `reset_timeout` seconds a few trial requests
+        are let through; a success closes the circuit again and a failure keeps it open for another period.
+
+        :param failure_threshold: (int, default=5) Consecutive failures that open a circuit
+        :param reset_timeout: (float, default=30) Seconds a circuit stays open before trial requests are sent
+        :param half_open_requests: (int, default=1) Trial requests allowed at once while half open
+        """
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_requests = half_open_requests
+        self.circuits = {}
+        self.lock = threading.Lock()
+
+    def _circuit(self, template):
+        circuit = self.circuits.get(template)
+        if circuit is None:
+            circuit = self.circuits[template] = {"state": CLOSED, "failures": 0, "opened_at": 0.0, "trials": 0, "rejected": 0}
+        return circuit
+
+    def allow(self, endpoint):
+        """Returns True when a request to the endpoint may be sent; every allowed request must be followed by `record`"""
+        template = endpoint_template(endpoint)
+        with self.lock:
+            circuit = self._circuit(template)
+            if circuit["state"] == OPEN:
+                if time.monotonic() - circuit["opened_at"] < self.reset_timeout:
+                    circuit["rejected"] += 1
+                    return False
+                circuit["state"] = HALF_OPEN
+                circuit["trials"] = 0
+
+            if circuit["state"] == HALF_OPEN:
+                if circuit["trials"] >= self.half_open_requests:
+                    # A trial whose outcome was never recorded must not keep the circuit half open forever
+                    if time.monotonic() - circuit["opened_at"] < 2 * self.reset_timeout:
+                        circuit["rejected"] += 1
+                        return False
+                    circuit["trials"] = 0
+                    circuit["opened_at"] = time.monotonic() - self.reset_timeout
+                circuit["trials"] += 1
+            return True
+
+    def record(self, endpoint, status):
+        """
+        Records the outcome of an allowed request
+
+        :param status: (int or None) HTTP status code, None after a connection error or timeout
+        """
+        template = endpoint_template(endpoint)
+        failed = status is None or status >= 500 or status == 429
+        with self.lock:
+            circuit = self._circuit(template)
+            if not failed:
+                circuit["state"] = CLOSED
+                circuit["failures"] = 0
+                return
+
+            circuit["failures"] += 1
+            if circuit["state"] == HALF_OPEN or circuit["failures"] >= self.failure_threshold:
+                circuit["state"] = OPEN
+                circuit["opened_at"] = time.monotonic()
+
+    def state(self, endpoint):
+        """Returns "closed", "open" or "half_open" for an endpoint"""
+        with self.lock:
+            return self._circuit(endpoint_template(endpoint))["state"]
+
+    def stats(self):
+        """Returns the state, consecutive failures and rejected requests per endpoint template"""
+        with self.lock:
+            return {template: {"state": circuit["state"], "failures": circuit["failures"], "rejected": circuit["rejected"]}
+                    for template, circuit in self.circuits.items()}
@@ -0,0 +1,91 @@
+import threading
+from collections import OrderedDict
+
+class ConditionalCache:
+
+    def __init__(self, maxsize=4096, max_bytes=32 * 1024 * 1024, max_entry_bytes=1024 * 1024):
+        """
+        Size-bounded LRU store of the validators (ETag and Last-Modified) and decoded body of GET responses.
+        Repeated reads are sent as conditional requests, and a 304 Not Modified answer is served from the stored body
+        without downloading or decoding it again. Unlike ResponseCache every read still asks the server,
+        so results are never stale. Stored bodies are shared between callers and must be treated as read-only.
+        Sizes are counted as the length of the received body; decoded JSON takes a few times more memory than that.
+
+        :param maxsize: (int, default=4096) Maximum number of stored responses
+        :param max_bytes: (int, default=32 MiB) Maximum total body size of the stored responses
+        :param max_entry_bytes: (int, default=1 MiB) Larger responses, e.g. big block pages, are not stored
+        """
+        for name, value in (("maxsize", maxsize), ("max_bytes", max_bytes), ("max_entry_bytes", max_entry_bytes)):
+            if not isinstance(value, int):
+                raise TypeError(f"{name} must be an integer, got {type(value).__name__}")
+
+            if value < 1:
+                raise ValueError(f"{name} must be at least 1")
+
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = min(max_entry_bytes, max_bytes)
+        self.bytes = 0
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        """Returns the stored `(etag, last_modified, data, size)` entry for a key, or None"""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+            return entry
+
+    @staticmethod
+    def headers(entry):
+        """Returns the conditional request headers for a stored entry"""
+        etag, last_modified = entry[0], entry[1]
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def set(self, key, etag, last_modified, data, size):
+        """
+        Stores a response body with its validators.
+        Responses without any validator, or with a body larger than `max_entry_bytes`, are not stored.
+
+        :param size: (int, required) Length of the received body in bytes
+        """
+        with self.lock:
+            previous = self.entries.pop(key, None)
+            if previous is not None:
+                self.bytes -= previous[3]
+            if (not etag and not last_modified) or size > self.max_entry_bytes:
+                return
+            self.entries[key] = (etag, last_modified, data, size)
+            self.bytes += size
+            while len(self.entries) > self.maxsize or self.bytes > self.max_bytes:
+                self.bytes -= self.entries.popitem(last=False)[1][3]
+
+    def record(self, not_modified):
+        """Counts the answer to a conditional request"""
+        with self.lock:
+            if not_modified:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def clear(self):
+        """Drops every stored response"""
+        with self.lock:
+            self.entries.clear()
+            self.bytes = 0
+
+    def stats(self):
+        """
+        Returns the hit/miss counters, the number of stored responses and their total body size in bytes;
+        a hit is a conditional request answered with 304
+        """
+        with self.lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self.entries), "bytes": self.bytes}
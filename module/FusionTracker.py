@@ -0,0 +1,243 @@
+import heapq
+import itertools
+import logging
+import re
+import threading
+import time
+from datetime import datetime, timezone
+
+EXPIRATION_KEYS = ("expiration", "expirationDate", "expiresAt", "expirationTime")
+_FRACTION = re.compile(r"(\.\d{6})\d+")
+
+def parse_expiration(data):
+    """
+    Converts the `data` of `fusion_expiration` into a datetime.
+    Accepts ISO 8601 strings (also with a "Z" suffix or .NET's 7 fractional digits), Unix timestamps in seconds
+    or milliseconds, and objects that hold one of these under an `expiration`-like key.
+
+    :return: timezone-aware datetime in UTC, or None when the address has no fusion
+    :raises ValueError: when the value cannot be read as a point in time
+    """
+    if isinstance(data, dict):
+        for key in EXPIRATION_KEYS:
+            if key in data:
+                return parse_expiration(data[key])
+        raise ValueError(f"No expiration in {data!r}")
+
+    if data is None or data == "" or data is False:
+        return None
+
+    if isinstance(data, str):
+        value = data.strip().strip('"')
+        try:
+            data = float(value)
+        except ValueError:
+            if value.endswith(("Z", "z")):
+                value = value[:-1] + "+00:00"
+            expiration = datetime.fromisoformat(_FRACTION.sub(r"\1", value))
+            if expiration.tzinfo is None:
+                expiration = expiration.replace(tzinfo=timezone.utc)
+            # .NET serializes a missing DateTime as 0001-01-01
+            if expiration.year <= 1:
+                return None
+            return expiration.astimezone(timezone.utc)
+
+    if isinstance(data, (int, float)):
+        if data <= 0:
+            return None
+        # Timestamps past the year 5000 in seconds are milliseconds
+        if data > 1e11:
+            data /= 1000
+        return datetime.fromtimestamp(data, tz=timezone.utc)
+
+    raise ValueError(f"Unsupported expiration {data!r}")
+
+class FusionTracker:
+
+    def __init__(self, client, lead_time=3600, renew=None, refresh_interval=21600, retry_interval=60,
+                 max_concurrency=10, plasma_watcher=None):
+        """
+        Keeps track of when the plasma-bot fusions of many addresses expire.
+        Each address is polled once to learn its expiration and is then kept in a min-heap ordered by the time
+        it has to be looked at again, so only addresses that are about to expire are queried.
+        With `renew` set, plasma is generated `lead_time` seconds before a fusion expires.
+
+        :param client: (ZenonWalletClient, required)
+        :param lead_time: (float, default=3600) Seconds before the expiration at which an address is checked again and renewed
+        :param renew: (str, optional) "bot" renews with `generate_plasma_bot`, "qsr" with `generate_plasma_qsr`; None only tracks
+        :param refresh_interval: (float, default=21600) Seconds between polls of an address that has no fusion
+        :param retry_interval: (float, default=60) Seconds before a failed poll or renewal is retried
+        :param max_concurrency: (int, default=10) Maximum number of expiration requests in flight per batch
+        :param plasma_watcher: (PlasmaWatcher, optional) Switched to fast polling for every renewed address
+        """
+        if renew not in (None, "bot", "qsr"):
+            raise ValueError(f"renew must be None, 'bot' or 'qsr', got {renew!r}")
+
+        self.client = client
+        self.lead_time = lead_time
+        self.renew = renew
+        self.refresh_interval = refresh_interval
+        self.retry_interval = retry_interval
+        self.max_concurrency = max_concurrency
+        self.plasma_watcher = plasma_watcher
+
+        self.condition = threading.Condition()
+        # Heap of (next_check, sequence, address); entries of untracked or rescheduled addresses are skipped lazily
+        self.heap = []
+        self.entries = {}
+        self.sequence = itertools.count()
+        self.counters = {"polls": 0, "renewals": 0, "failures": 0}
+        self.thread = None
+        self.running = False
+
+    def track(self, address):
+        """Starts tracking an address; its expiration is polled right away"""
+        self.track_many([address])
+
+    def track_many(self, addresses):
+        """Starts tracking many addresses; addresses that are already tracked keep their schedule"""
+        now = time.monotonic()
+        with self.condition:
+            for address in addresses:
+                if address not in self.entries:
+                    self.entries[address] = {"expiration": None, "next_check": now, "renewed_at": None}
+                    heapq.heappush(self.heap, (now, next(self.sequence), address))
+            self._start()
+            self.condition.notify()
+
+    def untrack(self, address):
+        """Stops tracking an address"""
+        with self.condition:
+            self.entries.pop(address, None)
+
+    def expiration(self, address):
+        """Returns the last known expiration of an address as a datetime, or None"""
+        with self.condition:
+            entry = self.entries.get(address)
+            return entry["expiration"] if entry is not None else None
+
+    def expiring(self, within=None):
+        """
+        Returns `(address, expiration)` pairs of the fusions that expire within `within` seconds, soonest first
+
+        :param within: (float, optional) Defaults to `lead_time`
+        """
+        limit = datetime.now(timezone.utc).timestamp() + (self.lead_time if within is None else within)
+        with self.condition:
+            expiring = [(address, entry["expiration"]) for address, entry in self.entries.items()
+                        if entry["expiration"] is not None and entry["expiration"].timestamp() <= limit]
+        return sorted(expiring, key=lambda pair: pair[1])
+
+    def stats(self):
+        """Returns the number of tracked addresses, expiration polls, renewals and failed calls"""
+        with self.condition:
+            return {"tracked": len(self.entries), **self.counters}
+
+    def _start(self):
+        if self.thread is None or not self.thread.is_alive():
+            self.running = True
+            self.thread = threading.Thread(target=self._run, name="FusionTracker", daemon=True)
+            self.thread.start()
+
+    def _due(self, now):
+        due = []
+        while self.heap and self.heap[0][0] <= now:
+            next_check, _, address = heapq.heappop(self.heap)
+            entry = self.entries.get(address)
+            if entry is not None and entry["next_check"] == next_check:
+                due.append(address)
+        return due
+
+    def _run(self):
+        while True:
+            with self.condition:
+                while self.running:
+                    now = time.monotonic()
+                    due = self._due(now)
+                    if due:
+                        break
+                    self.condition.wait(self.heap[0][0] - now if self.heap else None)
+                if not self.running:
+                    return
+
+            results = self.client.map_addresses(self.client.fusion_expiration, due, self.max_concurrency, ordered=False)
+            renewals = []
+            for address, result in results:
+                expiration = None
+                failed = result.get("status") != 200
+                if not failed:
+                    try:
+                        expiration = parse_expiration(result.get("data"))
+                    except ValueError as e:
+                        logging.error(f"Unexpected fusion expiration of {address}: {e}")
+                        failed = True
+                if self._update(address, expiration, failed):
+                    renewals.append(address)
+
+            if renewals:
+                generate = self.client.generate_plasma_bot if self.renew == "bot" else self.client.generate_plasma_qsr
+                for address, result in self.client.map_addresses(generate, renewals, self.max_concurrency, ordered=False):
+                    self._renewed(address, result)
+
+    def _update(self, address, expiration, failed):
+        """Reschedules a polled address. Returns True when its plasma has to be renewed."""
+        now = time.monotonic()
+        with self.condition:
+            entry = self.entries.get(address)
+            if entry is None:
+                return False
+
+            self.counters["polls"] += 1
+            if failed:
+                self.counters["failures"] += 1
+                self._schedule(address, entry, now + self.retry_interval)
+                return False
+
+            entry["expiration"] = expiration
+            remaining = expiration.timestamp() - time.time() if expiration is not None else None
+            if remaining is not None and remaining > self.lead_time:
+                entry["renewed_at"] = None
+                self._schedule(address, entry, now + remaining - self.lead_time)
+                return False
+
+            # The fusion is gone or about to expire; a renewal gets one lead time to show up in the expiration
+            renewed_at = entry["renewed_at"]
+            if self.renew is None or (renewed_at is not None and now - renewed_at < self.lead_time):
+                if remaining is not None and remaining > 0:
+                    self._schedule(address, entry, now + max(remaining, self.retry_interval))
+                elif self.renew is None:
+                    self._schedule(address, entry, now + self.refresh_interval)
+                else:
+                    self._schedule(address, entry, now + self.retry_interval)
+                return False
+
+            entry["renewed_at"] = now
+            self._schedule(address, entry, now + self.retry_interval)
+            return True
+
+    def _schedule(self, address, entry, next_check):
+        entry["next_check"] = next_check
+        heapq.heappush(self.heap, (next_check, next(self.sequence), address))
+
+    def _renewed(self, address, result):
+        with self.condition:
+            if result.get("status") != 200:
+                logging.error(f"Plasma renewal for {address} failed: {result.get('status')}")
+                self.counters["failures"] += 1
+                entry = self.entries.get(address)
+                if entry is not None:
+                    entry["renewed_at"] = None
+                return
+            self.counters["renewals"] += 1
+
+        logging.info(f"Renewed plasma fusion for {address}")
+        if self.plasma_watcher is not None:
+            self.plasma_watcher.notify_generated(address)
+
+    def close(self):
+        """Stops the scheduler thread; the known expirations stay readable"""
+        with self.condition:
+            self.running = False
+            self.condition.notify()
+        if self.thread is not None:
+            self.thread.join()
@@ -0,0 +1,79 @@
+import threading
+from collections import deque
+from .Metrics import endpoint_template
+
+class HedgePolicy:
+
+    def __init__(self, percentile=0.95, min_delay=0.005, max_delay=2.0, budget=0.05, window=1000, min_samples=20,
+                 max_workers=32):
+        """
+        When to send a duplicate of a slow idempotent GET request. The hedge goes out once the first attempt
+        has been waiting longer than the given latency percentile of its endpoint template,
+        and the first answer to arrive is used. A budget caps hedges to a fraction of all requests.
+
+        :param percentile: (float, default=0.95) Latency percentile after which a hedge is sent
+        :param min_delay: (float, default=0.005) Lower bound for the hedge delay in seconds
+        :param max_delay: (float, default=2.0) Upper bound for the hedge delay in seconds
+        :param budget: (float, default=0.05) Hedges allowed per request, e.g. 0.05 adds at most 5% load
+        :param window: (int, default=1000) Latest latencies per endpoint template used for the percentile
+        :param min_samples: (int, default=20) Latencies needed before an endpoint template is hedged
+        :param max_workers: (int, default=32) Threads the sync client runs hedged attempts on; while all are busy,
+                            requests are sent directly on the calling thread without a hedge
+        """
+        if not 0 < percentile < 1:
+            raise ValueError("percentile must be between 0 and 1")
+
+        if not 0 <= budget <= 1:
+            raise ValueError("budget must be between 0 and 1")
+
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.budget = budget
+        self.window = window
+        self.min_samples = min_samples
+        self.max_workers = max_workers
+        self.latencies = {}
+        self.delays = {}
+        self.tokens = 0.0
+        self.hedges = 0
+        self.lock = threading.Lock()
+
+    def delay(self, endpoint):
+        """Returns the seconds to wait before hedging a request, or None when it must not be hedged"""
+        template = endpoint_template(endpoint)
+        with self.lock:
+            # Every request earns a fraction of a hedge; the balance is capped so an idle period cannot build a burst
+            self.tokens = min(self.tokens + self.budget, 10.0)
+            return self.delays.get(template)
+
+    def record(self, endpoint, latency):
+        """Records the latency of a request that was answered"""
+        template = endpoint_template(endpoint)
+        with self.lock:
+            latencies = self.latencies.get(template)
+            if latencies is None:
+                latencies = self.latencies[template] = deque(maxlen=self.window)
+            latencies.append(latency)
+            # Sorting the window is cheap but not free, so the delay is refreshed every few samples
+            if len(latencies) >= self.min_samples and (len(latencies) % 10 == 0 or template not in self.delays):
+                ordered = sorted(latencies)
+                value = ordered[min(len(ordered) - 1, int(self.percentile * len(ordered)))]
+                self.delays[template] = min(self.max_delay, max(self.min_delay, value))
+
+    def try_hedge(self):
+        """Takes a hedge from the budget. Returns False when the budget is used up."""
+        with self.lock:
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            self.hedges += 1
+            return True
+
+    def stats(self):
+        """Returns the current hedge delay per endpoint template and the number of hedges sent"""
+        with self.lock:
+            return {"delays": dict(self.delays), "hedges": self.hedges}
@@ -0,0 +1,34 @@
+import json
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, the standard library is used without it
+    orjson = None
+
+class JsonCodec:
+
+    def __init__(self, name, loads, dumps):
+        """
+        Pair of JSON functions used by the client for request and response bodies.
+
+        :param name: (str, required)
+        :param loads: (callable, required) Decodes bytes or str; must raise ValueError on invalid JSON
+        :param dumps: (callable, required) Encodes an object to bytes
+        """
+        self.name = name
+        self.loads = loads
+        self.dumps = dumps
+
+    def __repr__(self):
+        return f"JsonCodec({self.name!r})"
+
+def _stdlib_dumps(obj):
+    return json.dumps(obj).encode()
+
+# Module-level functions keep the codecs picklable, so configs can be passed to worker processes
+STDLIB_CODEC = JsonCodec("json", json.loads, _stdlib_dumps)
+ORJSON_CODEC = JsonCodec("orjson", orjson.loads, orjson.dumps) if orjson is not None else None
+
+def default_codec():
+    """Returns the fastest installed codec: orjson when available, otherwise the standard library"""
+    return ORJSON_CODEC or STDLIB_CODEC
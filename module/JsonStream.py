@@ -0,0 +1,146 @@
+import codecs
+import json
+
+WHITESPACE = " \t\n\r"
+NUMBER_CHARACTERS = "0123456789.eE+-"
+
+class JsonArrayStream:
+
+    def __init__(self, key="list"):
+        """
+        Incremental parser for a JSON object whose `key` member is a large array, like an account-block page.
+        Bytes are fed as they arrive from the socket and the array items are returned as soon as each one is
+        complete, so only the item being parsed is held in memory. The other members are collected in `info`.
+
+        :param key: (str, default="list") Name of the array member to stream
+        """
+        self.key = key
+        self.info = {}
+        self.decoder = json.JSONDecoder()
+        self.text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self.buffer = ""
+        self.position = 0
+        self.state = "start"
+        self.current_key = None
+        self.eof = False
+
+    def feed(self, data):
+        """Parses the next chunk of bytes and returns the array items it completed"""
+        self.buffer = self.buffer[self.position:] + self.text_decoder.decode(data)
+        self.position = 0
+        return self._parse()
+
+    def close(self):
+        """Parses the remaining input and checks that the document was complete"""
+        self.buffer = self.buffer[self.position:] + self.text_decoder.decode(b"", final=True)
+        self.position = 0
+        self.eof = True
+        items = self._parse()
+        if self.state != "done":
+            raise ValueError("Incomplete JSON document")
+        return items
+
+    def _skip_whitespace(self):
+        buffer, position = self.buffer, self.position
+        while position < len(buffer) and buffer[position] in WHITESPACE:
+            position += 1
+        self.position = position
+        return position < len(buffer)
+
+    def _decode_value(self):
+        """Decodes the value at the current position, or returns (None, False) when more input is needed"""
+        try:
+            value, end = self.decoder.raw_decode(self.buffer, self.position)
+        except json.JSONDecodeError:
+            if self.eof:
+                raise
+            return None, False
+        # A number or literal that reaches the end of the buffer may continue in the next chunk
+        if not self.eof and (end == len(self.buffer) or self.buffer[end] in NUMBER_CHARACTERS):
+            return None, False
+        self.position = end
+        return value, True
+
+    def _expect(self, character):
+        if self.buffer[self.position] != character:
+            raise ValueError(f"Expected {character!r} at position {self.position}, got {self.buffer[self.position]!r}")
+        self.position += 1
+
+    def _parse(self):
+        items = []
+        while self.state != "done" and self._skip_whitespace():
+            character = self.buffer[self.position]
+
+            if self.state == "start":
+                self._expect("{")
+                self.state = "key"
+
+            elif self.state == "key":
+                if character == "}":
+                    self.position += 1
+                    self.state = "done"
+                    continue
+                key, complete = self._decode_value()
+                if not complete:
+                    break
+                if not isinstance(key, str):
+                    raise ValueError(f"Expected an object key, got {key!r}")
+                self.current_key = key
+                self.state = "colon"
+
+            elif self.state == "colon":
+                self._expect(":")
+                self.state = "value"
+
+            elif self.state == "value":
+                if self.current_key == self.key and character == "[":
+                    self.position += 1
+                    self.state = "item"
+                    continue
+                value, complete = self._decode_value()
+                if not complete:
+                    break
+                self.info[self.current_key] = value
+                self.state = "next_member"
+
+            elif self.state == "next_member":
+                if character == ",":
+                    self.position += 1
+                    self.state = "key"
+                else:
+                    self._expect("}")
+                    self.state = "done"
+
+            elif self.state == "item":
+                if character == "]":
+                    self.position += 1
+                    self.state = "next_member"
+                    continue
+                item, complete = self._decode_value()
+                if not complete:
+                    break
+                items.append(item)
+                self.state = "next_item"
+
+            elif self.state == "next_item":
+                if character == ",":
+                    self.position += 1
+                    self.state = "item"
+                else:
+                    self._expect("]")
+                    self.state = "next_member"
+
+        return items
+
+def iter_array_items(chunks, key="list", info=None):
+    """
+    Yields the items of the `key` array from an iterable of byte chunks, one at a time.
+
+    :param info: (dict, optional) Receives the other members of the object, e.g. `count` and `more`
+    """
+    stream = JsonArrayStream(key)
+    for chunk in chunks:
+        yield from stream.feed(chunk)
+    yield from stream.close()
+    if info is not None:
+        info.update(stream.info)
@@ -0,0 +1,130 @@
+import threading
+import time
+from .RateLimiter import endpoint_class
+from .RetryPolicy import RetryPolicy
+
+# Endpoint classes whose read-only calls may be answered by any instance
+READ_ENDPOINT_CLASSES = ("ledger", "utilities")
+
+def is_read_endpoint(method, endpoint):
+    """Read-only ledger and utility calls can go to any instance; wallet state, transfers and plasma stay on the primary"""
+    return RetryPolicy.is_idempotent(method, endpoint) and endpoint_class(endpoint) in READ_ENDPOINT_CLASSES
+
+class Instance:
+    """Health state of one Wallet API instance"""
+
+    def __init__(self, url):
+        self.url = url
+        self.average_latency = None
+        self.in_flight = 0
+        self.failures = 0
+        self.ejections = 0
+        self.ejected_until = 0.0
+        self.probing = False
+        self.requests = 0
+        self.errors = 0
+
+class LoadBalancer:
+
+    def __init__(self, urls, eject_after=3, eject_duration=10, max_eject_duration=300, slow_start=0.1):
+        """
+        Spreads read-only requests over several Wallet API instances, preferring healthy low-latency ones.
+        An instance is ejected after `eject_after` consecutive failures. When its ejection ends it gets one probe
+        request and is re-admitted after a success, or ejected again for twice as long.
+
+        :param urls: (list of str, required) Base URLs of the instances
+        :param eject_after: (int, default=3) Consecutive failures that eject an instance
+        :param eject_duration: (float, default=10) Seconds of the first ejection
+        :param max_eject_duration: (float, default=300) Upper bound for an ejection in seconds
+        :param slow_start: (float, default=0.1) Latency in seconds assumed for an instance without measurements
+        """
+        urls = list(dict.fromkeys(urls))
+        if not urls:
+            raise ValueError("at least one URL is required")
+
+        if eject_after < 1:
+            raise ValueError("eject_after must be at least 1")
+
+        self.instances = {url: Instance(url) for url in urls}
+        self.eject_after = eject_after
+        self.eject_duration = eject_duration
+        self.max_eject_duration = max_eject_duration
+        self.slow_start = slow_start
+        self.lock = threading.Lock()
+
+    def _score(self, instance):
+        # Expected wait for a new request: latency times the queue it would join
+        latency = instance.average_latency if instance.average_latency is not None else self.slow_start
+        return latency * (instance.in_flight + 1)
+
+    def acquire(self, exclude=()):
+        """
+        Picks the instance for the next request and counts it as in flight. Release it with `release`.
+        When every instance is ejected, the one whose ejection ends first is used, so requests are never refused.
+
+        :param exclude: (iterable of str, optional) URLs to avoid, e.g. the one that just failed, unless nothing else is left
+        """
+        now = time.monotonic()
+        with self.lock:
+            candidates = []
+            for instance in self.instances.values():
+                if instance.ejected_until > now or instance.probing:
+                    continue
+                if instance.ejected_until:
+                    # Ejection is over; let exactly one probe through before re-admitting the instance
+                    instance.probing = True
+                    instance.in_flight += 1
+                    return instance.url
+                candidates.append(instance)
+
+            preferred = [instance for instance in candidates if instance.url not in exclude]
+            if preferred or candidates:
+                instance = min(preferred or candidates, key=self._score)
+            else:
+                instance = min(self.instances.values(), key=lambda instance: instance.ejected_until)
+            instance.in_flight += 1
+            return instance.url
+
+    def release(self, url, latency, status):
+        """
+        Records the outcome of a request sent to an instance
+
+        :param status: (int or None) HTTP status code, None after a connection error or timeout
+        """
+        with self.lock:
+            instance = self.instances[url]
+            instance.in_flight -= 1
+            instance.requests += 1
+            failed = status is None or status >= 500 or status == 429
+
+            if failed:
+                instance.errors += 1
+                instance.failures += 1
+                if instance.probing or instance.failures >= self.eject_after:
+                    duration = min(self.max_eject_duration, self.eject_duration * 2 ** instance.ejections)
+                    instance.ejected_until = time.monotonic() + duration
+                    instance.ejections += 1
+                    instance.failures = 0
+            else:
+                instance.failures = 0
+                if instance.probing or instance.ejected_until:
+                    instance.ejections = 0
+                    instance.ejected_until = 0.0
+                instance.average_latency = latency if instance.average_latency is None else instance.average_latency * 0.8 + latency * 0.2
+            instance.probing = False
+
+    def cancel(self, url):
+        """Forgets a request that was abandoned before it finished, e.g. the slower copy of a hedged request"""
+        with self.lock:
+            instance = self.instances[url]
+            instance.in_flight -= 1
+            instance.probing = False
+
+    def stats(self):
+        """Returns the health of every instance"""
+        now = time.monotonic()
+        with self.lock:
+            return {url: {"healthy": instance.ejected_until <= now, "average_latency": instance.average_latency,
+                          "in_flight": instance.in_flight, "requests": instance.requests, "errors": instance.errors,
+                          "ejections": instance.ejections}
+                    for url, instance in self.instances.items()}
@@ -0,0 +1,196 @@
+import bisect
+import logging
+import re
+import socket
+import threading
+
+ADDRESS_PATTERN = re.compile(r"z1[0-9a-z]{38}")
+HASH_PATTERN = re.compile(r"\b[0-9a-f]{64}\b")
+
+# Upper bounds in seconds of the latency histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+def endpoint_template(endpoint):
+    """Turns an endpoint into its template, e.g. "/api/ledger/z1.../balances" into "/api/ledger/{address}/balances" """
+    path = endpoint.split("?", 1)[0]
+    return HASH_PATTERN.sub("{hash}", ADDRESS_PATTERN.sub("{address}", path))
+
+class Metrics:
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        """
+        Per-endpoint request metrics: latency and JSON decode time histograms, status-code counts,
+        bytes transferred and named counters such as retries and cache hits.
+        Received bytes are counted as they arrived on the wire, before decompression; the decompressed body size
+        is kept separately as decoded bytes, so the two show what compression saves.
+        Hooks receive every event as a dict, e.g. to forward them to StatsD.
+
+        :param buckets: (tuple, default=LATENCY_BUCKETS) Upper bounds in seconds of the histogram buckets
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.lock = threading.Lock()
+        self.endpoints = {}
+        self.counters = {}
+        self.hooks = []
+
+    def add_hook(self, hook):
+        """Calls `hook(event)` for every recorded event; `event["type"]` is "request" or a counter name"""
+        self.hooks.append(hook)
+
+    def _emit(self, event):
+        for hook in self.hooks:
+            try:
+                hook(event)
+            except Exception as e:
+                logging.warning(f"Metrics hook failed: {e}")
+
+    def _endpoint(self, method, template):
+        stats = self.endpoints.get((method, template))
+        if stats is None:
+            stats = self.endpoints[(method, template)] = {
+                "count": 0,
+                "latency_sum": 0.0,
+                "latency_buckets": [0] * (len(self.buckets) + 1),
+                "decode_sum": 0.0,
+                "decode_buckets": [0] * (len(self.buckets) + 1),
+                "statuses": {},
+                "bytes_sent": 0,
+                "bytes_received": 0,
+                "bytes_decoded": 0,
+            }
+        return stats
+
+    def record_request(self, method, endpoint, status, latency, decode_time=0.0, bytes_sent=0, bytes_received=0,
+                       bytes_decoded=0):
+        """
+        Records one HTTP request
+
+        :param status: (int or None) HTTP status code, None when no response arrived
+        :param latency: (float) Seconds until the response body was received
+        :param decode_time: (float) Seconds spent decoding the response body
+        :param bytes_received: (int) Body bytes read from the wire, before decompression
+        :param bytes_decoded: (int) Body bytes after decompression
+        """
+        template = endpoint_template(endpoint)
+        method = method.upper()
+        with self.lock:
+            stats = self._endpoint(method, template)
+            stats["count"] += 1
+            stats["latency_sum"] += latency
+            stats["latency_buckets"][bisect.bisect_left(self.buckets, latency)] += 1
+            stats["decode_sum"] += decode_time
+            stats["decode_buckets"][bisect.bisect_left(self.buckets, decode_time)] += 1
+            status_key = status if status is not None else "error"
+            stats["statuses"][status_key] = stats["statuses"].get(status_key, 0) + 1
+            stats["bytes_sent"] += bytes_sent
+            stats["bytes_received"] += bytes_received
+            stats["bytes_decoded"] += bytes_decoded
+
+        if self.hooks:
+            self._emit({"type": "request", "method": method, "endpoint": template, "status": status, "latency": latency,
+                        "decode_time": decode_time, "bytes_sent": bytes_sent, "bytes_received": bytes_received,
+                        "bytes_decoded": bytes_decoded})
+
+    def increment(self, name, endpoint, value=1):
+        """Increments a named counter for an endpoint, e.g. "retries", "cache_hits" or "cache_misses" """
+        template = endpoint_template(endpoint)
+        with self.lock:
+            self.counters[(name, template)] = self.counters.get((name, template), 0) + value
+
+        if self.hooks:
+            self._emit({"type": name, "endpoint": template, "value": value})
+
+    def snapshot(self):
+        """Returns a copy of all metrics as plain dicts"""
+        with self.lock:
+            endpoints = {}
+            for (method, template), stats in self.endpoints.items():
+                endpoints[f"{method} {template}"] = {
+                    **stats,
+                    "latency_buckets": list(stats["latency_buckets"]),
+                    "decode_buckets": list(stats["decode_buckets"]),
+                    "statuses": dict(stats["statuses"]),
+                }
+            counters = {}
+            for (name, template), value in self.counters.items():
+                counters.setdefault(name, {})[template] = value
+            return {"buckets": self.buckets, "endpoints": endpoints, "counters": counters}
+
+    def to_prometheus(self, prefix="zenon_wallet"):
+        """Renders all metrics in the Prometheus text exposition format"""
+        lines = []
+        with self.lock:
+            endpoints = sorted(self.endpoints.items())
+            counters = sorted(self.counters.items())
+
+            for metric, key, help_text in (
+                ("request_duration_seconds", "latency", "Time until the response body was received"),
+                ("decode_duration_seconds", "decode", "Time spent decoding response bodies"),
+            ):
+                lines.append(f"# HELP {prefix}_{metric} {help_text}")
+                lines.append(f"# TYPE {prefix}_{metric} histogram")
+                for (method, template), stats in endpoints:
+                    labels = f'method="{method}",endpoint="{template}"'
+                    cumulative = 0
+                    for bound, count in zip(self.buckets + ("+Inf",), stats[f"{key}_buckets"]):
+                        cumulative += count
+                        lines.append(f'{prefix}_{metric}_bucket{{{labels},le="{bound}"}} {cumulative}')
+                    lines.append(f"{prefix}_{metric}_sum{{{labels}}} {stats[f'{key}_sum']}")
+                    lines.append(f"{prefix}_{metric}_count{{{labels}}} {stats['count']}")
+
+            lines.append(f"# HELP {prefix}_responses_total Responses by status code")
+            lines.append(f"# TYPE {prefix}_responses_total counter")
+            for (method, template), stats in endpoints:
+                for status, count in sorted(stats["statuses"].items(), key=str):
+                    lines.append(f'{prefix}_responses_total{{method="{method}",endpoint="{template}",status="{status}"}} {count}')
+
+            for key in ("bytes_sent", "bytes_received", "bytes_decoded"):
+                lines.append(f"# TYPE {prefix}_{key}_total counter")
+                for (method, template), stats in endpoints:
+                    lines.append(f'{prefix}_{key}_total{{method="{method}",endpoint="{template}"}} {stats[key]}')
+
+            names = sorted({name for (name, _), _ in counters})
+            for name in names:
+                lines.append(f"# TYPE {prefix}_{name}_total counter")
+                for (counter_name, template), value in counters:
+                    if counter_name == name:
+                        lines.append(f'{prefix}_{name}_total{{endpoint="{template}"}} {value}')
+
+        return "\n".join(lines) + "\n"
+
+class StatsDExporter:
+
+    def __init__(self, host="127.0.0.1", port=8125, prefix="zenon_wallet"):
+        """
+        Metrics hook that sends every event to a StatsD server over UDP.
+        Use it with `metrics.add_hook(StatsDExporter(...))`.
+        """
+        self.address = (host, port)
+        self.prefix = prefix
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    @staticmethod
+    def _name(template):
+        return template.strip("/").replace("/", ".").replace("{", "").replace("}", "").replace("-", "_")
+
+    def __call__(self, event):
+        name = f"{self.prefix}.{self._name(event['endpoint'])}"
+        if event["type"] == "request":
+            status = event["status"] if event["status"] is not None else "error"
+            lines = [
+                f"{name}.latency:{event['latency'] * 1000:.3f}|ms",
+                f"{name}.decode:{event['decode_time'] * 1000:.3f}|ms",
+                f"{name}.status.{status}:1|c",
+                f"{name}.bytes_sent:{event['bytes_sent']}|c",
+                f"{name}.bytes_received:{event['bytes_received']}|c",
+                f"{name}.bytes_decoded:{event['bytes_decoded']}|c",
+            ]
+        else:
+            lines = [f"{name}.{event['type']}:{event['value']}|c"]
+        try:
+            self.socket.sendto("\n".join(lines).encode(), self.address)
+        except OSError:
+            pass
+
+    def close(self):
+        self.socket.close()
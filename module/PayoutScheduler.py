@@ -0,0 +1,198 @@
+import logging
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from .PlasmaWatcher import PlasmaWatcher
+
+class PayoutScheduler:
+
+    def __init__(self, client, plasma_watcher=None, max_senders=10, max_attempts=10, retry_delay=10,
+                 plasma_timeout=1800, check_plasma=True):
+        """
+        Payout queue for many transfers. Transfers of one sender are sent strictly in order, because each
+        account chain is sequential, while different senders are sent in parallel.
+        Neither a failed send nor a receiver without plasma holds a worker thread: the sender is resumed
+        by a timer or by the plasma watcher, and the other senders keep going.
+
+        :param client: (ZenonWalletClient, required)
+        :param plasma_watcher: (PlasmaWatcher, optional) Shared watcher; a private one is created when omitted
+        :param max_senders: (int, default=10) Maximum number of senders sending at the same time
+        :param max_attempts: (int, default=10) Send and plasma generation attempts per transfer before it fails
+        :param retry_delay: (float, default=10) Seconds before a failed send is retried
+        :param plasma_timeout: (float, default=1800) Seconds to wait for plasma before a transfer fails
+        :param check_plasma: (bool, default=True) Check receiver plasma once per batch and generate it when missing
+        """
+        self.client = client
+        self.own_watcher = plasma_watcher is None
+        self.plasma_watcher = plasma_watcher if plasma_watcher is not None else PlasmaWatcher(client)
+        self.max_senders = max_senders
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.plasma_timeout = plasma_timeout
+        self.check_plasma = check_plasma
+
+        self.executor = ThreadPoolExecutor(max_workers=max_senders)
+        self.lock = threading.Lock()
+        self.queues = {}
+        self.active = set()
+        self.futures = set()
+
+    def submit(self, receiver, amount, tokenStandard="ZNN", sender=None):
+        """
+        Queues a transfer.
+
+        :param receiver: (str, required) The recipient address
+        :param amount: (str, required) The amount to send
+        :param tokenStandard: (str, optional) Defaults to "ZNN"
+        :param sender: (str, optional) Defaults to the wallet's primary address
+        :return: Future that resolves to the `send_tokens` result of the last attempt
+        """
+        sender = sender or self.client.address
+        future = Future()
+        transfer = {"sender": sender, "receiver": receiver, "amount": amount, "tokenStandard": tokenStandard,
+                    "future": future, "attempts": 0}
+        with self.lock:
+            self.queues.setdefault(sender, deque()).append(transfer)
+            self.futures.add(future)
+            start = sender not in self.active
+            self.active.add(sender)
+        future.add_done_callback(self._forget)
+        if start:
+            self.executor.submit(self._drain, sender)
+        return future
+
+    def submit_many(self, transfers):
+        """
+        Queues many transfers.
+
+        :param transfers: (iterable of dict) Keyword arguments for `submit`
+        :return: list of Futures in input order
+        """
+        return [self.submit(**transfer) for transfer in transfers]
+
+    def _forget(self, future):
+        with self.lock:
+            self.futures.discard(future)
+
+    def _finish(self, sender, transfer, result=None, exception=None):
+        with self.lock:
+            queue = self.queues[sender]
+            if queue and queue[0] is transfer:
+                queue.popleft()
+        # The caller may have cancelled the future in the meantime
+        if transfer["future"].done():
+            return
+        if exception is not None:
+            transfer["future"].set_exception(exception)
+        else:
+            transfer["future"].set_result(result)
+
+    def _resume(self, sender):
+        self.executor.submit(self._drain, sender)
+
+    def _retry_later(self, sender):
+        timer = threading.Timer(self.retry_delay, self._resume, args=(sender,))
+        timer.daemon = True
+        timer.start()
+
+    def _drain(self, sender):
+        """Sends the queued transfers of one sender in order, until the queue is empty or the sender has to wait"""
+        try:
+            while True:
+                with self.lock:
+                    # Cancelled transfers are dropped before anything is sent for them
+                    batch = [transfer for transfer in self.queues.get(sender, ()) if not transfer["future"].cancelled()]
+                    self.queues[sender] = deque(batch)
+                    if not batch:
+                        self.active.discard(sender)
+                        self.queues.pop(sender, None)
+                        return
+
+                missing_plasma = set()
+                if self.check_plasma:
+                    # Check every receiver of the batch once, instead of once per transfer
+                    receivers = list(dict.fromkeys(transfer["receiver"] for transfer in batch))
+                    for receiver, result in self.client.ledger_plasma_info_many(receivers):
+                        data = result.get("data")
+                        if result.get("status") != 200 or not isinstance(data, dict) or not data.get("currentPlasma"):
+                            missing_plasma.add(receiver)
+
+                for transfer in batch:
+                    if transfer["future"].cancelled():
+                        self._finish(sender, transfer)
+                        continue
+                    if transfer["receiver"] in missing_plasma:
+                        self._wait_for_plasma(sender, transfer)
+                        return
+                    if not self._send(sender, transfer):
+                        return
+        except Exception as e:
+            logging.error(f"Payout scheduler for {sender} failed: {e}")
+            with self.lock:
+                batch = list(self.queues.pop(sender, ()))
+                self.active.discard(sender)
+            for transfer in batch:
+                if not transfer["future"].done():
+                    transfer["future"].set_exception(e)
+
+    def _send(self, sender, transfer):
+        """Sends one transfer. Returns False when the sender has to wait for a retry"""
+        try:
+            result = self.client.send_tokens(sender=sender, receiver=transfer["receiver"], amount=transfer["amount"],
+                                             tokenStandard=transfer["tokenStandard"])
+        except (TypeError, ValueError) as e:
+            self._finish(sender, transfer, exception=e)
+            return True
+
+        transfer["attempts"] += 1
+        if result.get("status") == 200:
+            logging.info(f"Transaction: {transfer['amount']} {transfer['tokenStandard']} from {sender} to {transfer['receiver']}")
+            self._finish(sender, transfer, result)
+            return True
+
+        if transfer["attempts"] >= self.max_attempts:
+            logging.error(f"Transaction failed after {transfer['attempts']} attempts: {result.get('status')}")
+            self._finish(sender, transfer, result)
+            return True
+
+        logging.warning(f"Transaction failed. Try again after {self.retry_delay} seconds. (Attempt {transfer['attempts']})")
+        self._retry_later(sender)
+        return False
+
+    def _wait_for_plasma(self, sender, transfer):
+        """Generates plasma for the receiver and resumes the sender once it appears"""
+        def resume(plasma_future):
+            if plasma_future.cancelled() or not plasma_future.result():
+                logging.error(f"Timeout. Transaction to {transfer['receiver']} failed.")
+                self._finish(sender, transfer, {"status": None, "data": None})
+            self._resume(sender)
+
+        result = self.client.generate_plasma_bot(transfer["receiver"])
+        if result.get("status") != 200:
+            # A failed generation counts as an attempt and is retried like a failed send
+            transfer["attempts"] += 1
+            if transfer["attempts"] >= self.max_attempts:
+                logging.error(f"Plasma generation for {transfer['receiver']} failed after {transfer['attempts']} attempts: {result.get('status')}")
+                self._finish(sender, transfer, result)
+                self._resume(sender)
+                return
+            logging.warning(f"Plasma generation for {transfer['receiver']} failed: {result.get('status')}. "
+                            f"Try again after {self.retry_delay} seconds. (Attempt {transfer['attempts']})")
+            self._retry_later(sender)
+            return
+
+        self.plasma_watcher.watch(transfer["receiver"], timeout=self.plasma_timeout).add_done_callback(resume)
+        self.plasma_watcher.notify_generated(transfer["receiver"])
+
+    def join(self, timeout=None):
+        """Waits until every transfer queued so far has finished. Returns False on timeout"""
+        with self.lock:
+            futures = list(self.futures)
+        return not wait(futures, timeout=timeout).not_done
+
+    def close(self):
+        """Waits for every queued transfer and stops the workers"""
+        self.join()
+        self.executor.shutdown()
+        if self.own_watcher:
+            self.plasma_watcher.close()
@@ -0,0 +1,157 @@
+import logging
+import threading
+import time
+from concurrent.futures import Future
+
+def _resolve(future, value):
+    # Callers may have cancelled their future in the meantime
+    if not future.done():
+        future.set_result(value)
+
+class PlasmaWatcher:
+
+    def __init__(self, client, min_interval=2, max_interval=120, backoff=2, max_concurrency=10):
+        """
+        Waits for plasma on many addresses from a single scheduler thread.
+        Due addresses are polled together in one batch; each address starts at `min_interval`
+        and backs off to `max_interval`, and `notify_generated` resets it to fast polling.
+
+        :param client: (ZenonWalletClient, required)
+        :param min_interval: (float, default=2) Seconds between polls right after watching or generating plasma
+        :param max_interval: (float, default=120) Upper bound for the seconds between polls
+        :param backoff: (float, default=2) Factor the interval grows by after every poll without plasma
+        :param max_concurrency: (int, default=10) Maximum number of plasma requests in flight per batch
+        """
+        self.client = client
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.max_concurrency = max_concurrency
+
+        self.condition = threading.Condition()
+        self.watches = {}
+        self.thread = None
+        self.running = False
+
+    def watch(self, address, timeout=1800, required_plasma=1):
+        """
+        Watches an address until its current plasma reaches `required_plasma`.
+
+        :param address: (str, required)
+        :param timeout: (float, default=1800) Seconds before giving up
+        :param required_plasma: (int, default=1)
+        :return: Future that resolves to True as soon as plasma appears, or False on timeout
+        """
+        future = Future()
+        now = time.monotonic()
+        with self.condition:
+            watch = self.watches.get(address)
+            if watch is None:
+                watch = self.watches[address] = {"waiters": [], "interval": self.min_interval, "next_poll": now}
+            watch["waiters"].append((future, now + timeout, required_plasma))
+            self._start()
+            self.condition.notify()
+        return future
+
+    def notify_generated(self, address):
+        """Switches an address back to fast polling, e.g. right after `generate_plasma_bot`"""
+        with self.condition:
+            watch = self.watches.get(address)
+            if watch is not None:
+                watch["interval"] = self.min_interval
+                watch["next_poll"] = min(watch["next_poll"], time.monotonic() + self.min_interval)
+                self.condition.notify()
+
+    def generate(self, address, timeout=1800):
+        """
+        Generates plasma for an address from the plasma-bot and watches it.
+
+        :return: Future that resolves to True as soon as plasma appears, or False on timeout or when generation failed
+        """
+        result = self.client.generate_plasma_bot(address)
+        if result.get("status") != 200:
+            logging.error(f"API call failed: {result.get('status')}")
+            future = Future()
+            future.set_result(False)
+            return future
+
+        future = self.watch(address, timeout=timeout)
+        self.notify_generated(address)
+        return future
+
+    def _start(self):
+        if self.thread is None or not self.thread.is_alive():
+            self.running = True
+            self.thread = threading.Thread(target=self._run, name="PlasmaWatcher", daemon=True)
+            self.thread.start()
+
+    def _run(self):
+        while True:
+            with self.condition:
+                while self.running:
+                    now = time.monotonic()
+                    self._expire(now)
+                    due = [address for address, watch in self.watches.items() if watch["next_poll"] <= now]
+                    if due:
+                        break
+                    wakeups = [watch["next_poll"] for watch in self.watches.values()]
+                    wakeups += [deadline for watch in self.watches.values() for _, deadline, _ in watch["waiters"]]
+                    self.condition.wait(min(wakeups) - now if wakeups else None)
+                if not self.running:
+                    return
+
+            results = self.client.ledger_plasma_info_many(due, max_concurrency=self.max_concurrency, ordered=False)
+            for address, result in results:
+                current_plasma = None
+                if result.get("status") == 200 and isinstance(result.get("data"), dict):
+                    current_plasma = result["data"].get("currentPlasma") or 0
+                self._update(address, current_plasma)
+
+    def _update(self, address, current_plasma):
+        with self.condition:
+            watch = self.watches.get(address)
+            if watch is None:
+                return
+
+            if current_plasma is not None:
+                waiting = []
+                for waiter in watch["waiters"]:
+                    future, _, required_plasma = waiter
+                    if current_plasma >= required_plasma:
+                        _resolve(future, True)
+                    else:
+                        waiting.append(waiter)
+                watch["waiters"] = waiting
+
+            if not watch["waiters"]:
+                del self.watches[address]
+                return
+
+            logging.debug(f"Waiting for plasma on {address}. Next poll in {watch['interval']} seconds.")
+            watch["next_poll"] = time.monotonic() + watch["interval"]
+            watch["interval"] = min(watch["interval"] * self.backoff, self.max_interval)
+
+    def _expire(self, now):
+        for address in list(self.watches):
+            watch = self.watches[address]
+            waiting = []
+            for waiter in watch["waiters"]:
+                if waiter[1] <= now:
+                    _resolve(waiter[0], False)
+                else:
+                    waiting.append(waiter)
+            watch["waiters"] = waiting
+            if not waiting:
+                del self.watches[address]
+
+    def close(self):
+        """Stops the scheduler thread and cancels every pending watch"""
+        with self.condition:
+            self.running = False
+            for watch in self.watches.values():
+                for future, _, _ in watch["waiters"]:
+                    future.cancel()
+            self.watches.clear()
+            self.condition.notify()
+        if self.thread is not None:
+            self.thread.join()
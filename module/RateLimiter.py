@@ -0,0 +1,190 @@
+import asyncio
+import threading
+import time
+
+# Status codes that mean the node is overloaded
+OVERLOAD_STATUSES = (429, 503)
+
+def endpoint_class(endpoint):
+    """Returns the class of an endpoint, e.g. "ledger" for "/api/ledger/{address}/balances" """
+    parts = endpoint.split("?", 1)[0].strip("/").split("/")
+    if len(parts) > 1 and parts[0] == "api":
+        return parts[1]
+    return parts[0]
+
+class EndpointLimiter:
+
+    def __init__(self, rate=None, burst=None, concurrency=10, min_concurrency=1, max_concurrency=100,
+                 latency_tolerance=3.0, decrease=0.5):
+        """
+        Request budget of one endpoint class: a token bucket for the request rate and an AIMD limit for requests in flight.
+        The in-flight limit grows by one per round of healthy responses and is multiplied by `decrease`
+        after a 429 or 503 response, a connection error or timeout, or a latency spike.
+
+        :param rate: (float, optional) Requests per second; None leaves the rate unlimited
+        :param burst: (int, optional) Requests that may be sent at once after an idle period; defaults to the rate
+        :param concurrency: (int, default=10) Initial in-flight limit
+        :param min_concurrency: (int, default=1) Lowest in-flight limit
+        :param max_concurrency: (int, default=100) Highest in-flight limit
+        :param latency_tolerance: (float, default=3.0) A response slower than this multiple of the average latency counts as a spike
+        :param decrease: (float, default=0.5) Factor applied to the in-flight limit on overload
+        """
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be positive")
+
+        if not 1 <= min_concurrency <= concurrency <= max_concurrency:
+            raise ValueError("concurrency limits must satisfy 1 <= min_concurrency <= concurrency <= max_concurrency")
+
+        if not 0 < decrease < 1:
+            raise ValueError("decrease must be between 0 and 1")
+
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, rate or 1)
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self.limit = float(concurrency)
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.latency_tolerance = latency_tolerance
+        self.decrease = decrease
+        self.in_flight = 0
+        self.average_latency = None
+        self.last_decrease = 0.0
+        self.throttled = 0
+        self.condition = threading.Condition()
+        self.async_waiters = []
+
+    def _reserve(self):
+        """Takes a slot and a token if both are free; otherwise returns the seconds to wait, or None to wait for a release"""
+        if self.in_flight >= int(self.limit):
+            return None
+
+        if self.rate is not None:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens < 1:
+                return (1 - self.tokens) / self.rate
+            self.tokens -= 1
+
+        self.in_flight += 1
+        return 0
+
+    def acquire(self):
+        """Blocks until a request may be sent. Returns True when the caller had to wait."""
+        start = time.monotonic()
+        with self.condition:
+            while True:
+                wait = self._reserve()
+                if wait == 0:
+                    break
+                self.condition.wait(wait)
+        throttled = time.monotonic() - start > 0.001
+        if throttled:
+            with self.condition:
+                self.throttled += 1
+        return throttled
+
+    async def acquire_async(self):
+        """Waits without blocking the event loop until a request may be sent. Returns True when the caller had to wait."""
+        loop = asyncio.get_running_loop()
+        start = time.monotonic()
+        while True:
+            with self.condition:
+                wait = self._reserve()
+                if wait is None:
+                    future = loop.create_future()
+                    self.async_waiters.append((loop, future))
+            if wait == 0:
+                break
+            if wait is None:
+                await future
+            else:
+                await asyncio.sleep(wait)
+        throttled = time.monotonic() - start > 0.001
+        if throttled:
+            with self.condition:
+                self.throttled += 1
+        return throttled
+
+    def release(self, latency, status):
+        """
+        Frees the slot of a finished request and adapts the in-flight limit
+
+        :param latency: (float) Seconds the request took
+        :param status: (int or None) HTTP status code, None after a connection error or timeout
+        """
+        with self.condition:
+            busy = self.in_flight >= self.limit / 2
+            self.in_flight -= 1
+            spike = self.average_latency is not None and latency > self.average_latency * self.latency_tolerance
+
+            if status is None or status in OVERLOAD_STATUSES or spike:
+                now = time.monotonic()
+                # Requests sent before the last decrease report the same overload, so cut at most once per round trip
+                if now - self.last_decrease > (self.average_latency or latency):
+                    self.limit = max(self.min_concurrency, self.limit * self.decrease)
+                    self.last_decrease = now
+            elif busy:
+                # Only grow a limit that is actually used, so an idle client does not build up a burst
+                self.limit = min(self.max_concurrency, self.limit + 1 / self.limit)
+
+            if status is not None and status not in OVERLOAD_STATUSES:
+                self.average_latency = latency if self.average_latency is None else self.average_latency * 0.9 + latency * 0.1
+
+            self.condition.notify_all()
+            waiters, self.async_waiters = self.async_waiters, []
+
+        for loop, future in waiters:
+            loop.call_soon_threadsafe(_wake, future)
+
+    def cancel(self):
+        """Frees the slot of a request that was abandoned before it finished, without adapting the limit"""
+        with self.condition:
+            self.in_flight -= 1
+            self.condition.notify_all()
+            waiters, self.async_waiters = self.async_waiters, []
+
+        for loop, future in waiters:
+            loop.call_soon_threadsafe(_wake, future)
+
+    def stats(self):
+        """Returns the current in-flight limit, requests in flight, average latency and how often callers had to wait"""
+        with self.condition:
+            return {"limit": int(self.limit), "in_flight": self.in_flight, "average_latency": self.average_latency,
+                    "throttled": self.throttled}
+
+def _wake(future):
+    if not future.done():
+        future.set_result(None)
+
+class RateLimiter:
+
+    def __init__(self, limits=None, default=None):
+        """
+        Separate request budgets per endpoint class, e.g. ledger reads and transfers.
+
+        :param limits: (dict, optional) Endpoint class to EndpointLimiter keyword arguments, e.g. {"transfer": {"rate": 5}}
+        :param default: (dict, optional) Keyword arguments for the classes not in `limits`
+        """
+        self.limits = dict(limits or {})
+        self.default = dict(default or {})
+        self.limiters = {}
+        self.lock = threading.Lock()
+
+    def limiter(self, endpoint):
+        """Returns the EndpointLimiter of the class of an endpoint, creating it on first use"""
+        name = endpoint_class(endpoint)
+        limiter = self.limiters.get(name)
+        if limiter is None:
+            with self.lock:
+                limiter = self.limiters.get(name)
+                if limiter is None:
+                    limiter = self.limiters[name] = EndpointLimiter(**self.limits.get(name, self.default))
+        return limiter
+
+    def stats(self):
+        """Returns the stats of every endpoint class used so far"""
+        with self.lock:
+            limiters = dict(self.limiters)
+        return {name: limiter.stats() for name, limiter in limiters.items()}
@@ -0,0 +1,134 @@
+import re
+import threading
+import time
+from collections import OrderedDict
+
+ADDRESS_PATTERN = re.compile(r"z1[0-9a-z]{38}")
+
+# Time to live in seconds for every cacheable endpoint. Wallet endpoints are never cached, and neither are
+# the paged block lists by default, since a page iterator would mix cached and fresh pages of a changing list.
+DEFAULT_TTLS = {
+    "/api/ledger/{address}/balances": 5,
+    "/api/ledger/{address}/plasma": 5,
+    "/api/ledger/{address}/fused": 30,
+    "/api/auto-receiver/status": 5,
+    "/api/utilities/plasma-bot/expiration/{address}": 60,
+    "/api/utilities/address/validate": 3600,
+}
+
+def _compile_template(template):
+    pattern = re.escape(template).replace(re.escape("{address}"), r"[^/?]+")
+    return re.compile(f"^{pattern}(\\?.*)?$")
+
+class ResponseCache:
+
+    def __init__(self, maxsize=1024, ttls=None):
+        """
+        Size-bounded LRU cache with per-endpoint TTLs for read-only API responses.
+        Cached results are shared between callers and must be treated as read-only.
+
+        :param maxsize: (int, default=1024) Maximum number of cached responses
+        :param ttls: (dict, optional) Endpoint template to TTL in seconds, e.g. {"/api/ledger/{address}/plasma": 2}.
+                     Overrides the matching entries of DEFAULT_TTLS; a TTL of 0 disables caching for that endpoint
+        """
+        if not isinstance(maxsize, int):
+            raise TypeError(f"maxsize must be an integer, got {type(maxsize).__name__}")
+
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+
+        ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.maxsize = maxsize
+        self.ttls = [(_compile_template(template), ttl) for template, ttl in ttls.items() if ttl]
+        self.entries = OrderedDict()
+        self.addresses = {}
+        # Bumped by every invalidation, so a read that was in flight during a write is not stored afterwards
+        self.generations = {}
+        self.epoch = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def ttl(self, endpoint):
+        """Returns the TTL for an endpoint, or None when it is not cacheable"""
+        for pattern, ttl in self.ttls:
+            if pattern.match(endpoint):
+                return ttl
+        return None
+
+    def get(self, key):
+        """Returns the cached result for a key, or None when it is missing or expired"""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def _generation(self, key):
+        return self.epoch, tuple(self.generations.get(address, 0) for address in ADDRESS_PATTERN.findall(key))
+
+    def generation(self, key):
+        """Returns the invalidation state of a key; take it before sending the request and pass it to `set`"""
+        with self.lock:
+            return self._generation(key)
+
+    def set(self, key, result, ttl, generation=None):
+        """
+        Stores a result for `ttl` seconds, evicting the least recently used entries when full.
+        When `generation` is given and an address of the key was invalidated since it was taken, nothing is stored,
+        because the result may have been read before the write that invalidated it.
+        """
+        with self.lock:
+            if generation is not None and generation != self._generation(key):
+                return
+            if key in self.entries:
+                self._remove(key)
+            self.entries[key] = (time.monotonic() + ttl, result)
+            for address in ADDRESS_PATTERN.findall(key):
+                self.addresses.setdefault(address, set()).add(key)
+            while len(self.entries) > self.maxsize:
+                self._remove(next(iter(self.entries)))
+
+    def _remove(self, key):
+        self.entries.pop(key, None)
+        for address in ADDRESS_PATTERN.findall(key):
+            keys = self.addresses.get(address)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.addresses[address]
+
+    def invalidate_address(self, address):
+        """Drops every cached response that belongs to an address"""
+        with self.lock:
+            self.generations[address] = self.generations.get(address, 0) + 1
+            for key in list(self.addresses.get(address, ())):
+                self._remove(key)
+
+    def invalidate_write(self, endpoint, payload=None):
+        """Drops the cached responses of every address touched by a write request"""
+        addresses = set(ADDRESS_PATTERN.findall(endpoint))
+        if isinstance(payload, dict):
+            for value in payload.values():
+                if isinstance(value, str):
+                    addresses.update(ADDRESS_PATTERN.findall(value))
+        for address in addresses:
+            self.invalidate_address(address)
+
+    def clear(self):
+        """Drops every cached response"""
+        with self.lock:
+            self.entries.clear()
+            self.addresses.clear()
+            self.generations.clear()
+            self.epoch += 1
+
+    def stats(self):
+        """Returns the hit/miss counters and the current size"""
+        with self.lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self.entries)}
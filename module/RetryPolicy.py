@@ -0,0 +1,51 @@
+import random
+
+# Read-only POST endpoints that are safe to send more than once
+IDEMPOTENT_POST_ENDPOINTS = ("/api/utilities/address/validate",)
+
+class RetryPolicy:
+
+    def __init__(self, max_retries=2, backoff_factor=0.5, backoff_max=10, retry_statuses=(500, 502, 503, 504)):
+        """
+        Retries for idempotent requests after connection errors, timeouts and transient server errors,
+        waiting a jittered exponential backoff between attempts.
+
+        :param max_retries: (int, default=2) Retries after the first attempt; 0 disables retries
+        :param backoff_factor: (float, default=0.5) Base delay in seconds, doubled after every attempt
+        :param backoff_max: (float, default=10) Upper bound for a single delay in seconds
+        :param retry_statuses: (tuple, default=(500, 502, 503, 504)) HTTP status codes that are retried
+        """
+        if not isinstance(max_retries, int):
+            raise TypeError(f"max_retries must be an integer, got {type(max_retries).__name__}")
+
+        if max_retries < 0:
+            raise ValueError("max_retries must be at least 0")
+
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.retry_statuses = frozenset(retry_statuses)
+
+    @staticmethod
+    def is_idempotent(method, endpoint):
+        """GET requests and read-only POST endpoints can be retried; wallet writes and transfers never are"""
+        if method.upper() != "POST":
+            return True
+        return endpoint.split("?", 1)[0] in IDEMPOTENT_POST_ENDPOINTS
+
+    def retries_for(self, method, endpoint):
+        """Returns how many times a request may be retried"""
+        return self.max_retries if self.is_idempotent(method, endpoint) else 0
+
+    def delay(self, attempt, retry_after=None):
+        """
+        Returns the seconds to wait before retry number `attempt` (starting at 0), using full jitter.
+        A numeric Retry-After header from the server is respected as a lower bound.
+        """
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_factor * (2 ** attempt)))
+        if retry_after:
+            try:
+                delay = max(delay, min(float(retry_after), self.backoff_max))
+            except ValueError:
+                pass
+        return delay
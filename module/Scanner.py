@@ -0,0 +1,223 @@
+import copy
+import itertools
+import logging
+import os
+import signal
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from .AddressValidator import is_valid_address
+from .Balances import TokenBalance, parse_balances, token_info
+from .RateLimiter import RateLimiter
+from .ZenonWalletClient import ZenonWalletClient
+
+SCAN_FIELDS = ("balances", "plasma", "fusions")
+
+def balance_record(balance):
+    """JSON-ready form of a TokenBalance; amounts are strings so no precision is lost"""
+    return {
+        "tokenStandard": balance.token.tokenStandard,
+        "name": balance.token.name,
+        "symbol": balance.token.symbol,
+        "decimals": balance.token.decimals,
+        "raw": str(balance.raw),
+        "amount": balance.format(),
+    }
+
+def scan_address(client, address, fields=SCAN_FIELDS):
+    """
+    Queries the balances, plasma and fusion entries of one address
+
+    :param fields: (iterable of str, default=SCAN_FIELDS) Which of "balances", "plasma" and "fusions" to query
+    :return: dict with the `address`, one member per field, and `errors` with the status of every failed call
+    """
+    record = {"address": address}
+    if not is_valid_address(address):
+        record["errors"] = {"address": "invalid address"}
+        return record
+
+    errors = {}
+    if "balances" in fields:
+        result = client.ledger_account_info(address)
+        if result.get("status") == 200:
+            record["balances"] = [balance_record(balance) for balance in parse_balances(result.get("data"))]
+        else:
+            errors["balances"] = result.get("status")
+
+    if "plasma" in fields:
+        result = client.ledger_plasma_info(address)
+        if result.get("status") == 200:
+            record["plasma"] = result.get("data")
+        else:
+            errors["plasma"] = result.get("status")
+
+    if "fusions" in fields:
+        result = client.ledger_fusion_entries(address)
+        if result.get("status") == 200:
+            record["fusions"] = result.get("data")
+        else:
+            errors["fusions"] = result.get("status")
+
+    if errors:
+        record["errors"] = errors
+    return record
+
+def add_totals(totals, record):
+    """
+    Adds the balances of a scan record to per-token totals
+
+    :param totals: (dict) Token standard to TokenBalance, updated in place
+    """
+    for balance in record.get("balances") or ():
+        total = totals.get(balance["tokenStandard"])
+        if total is None:
+            totals[balance["tokenStandard"]] = TokenBalance(token_info(balance["tokenStandard"], balance), int(balance["raw"]))
+        else:
+            total.raw += int(balance["raw"])
+
+def scan(client, addresses, fields=SCAN_FIELDS, max_concurrency=10, offset=0, start=0):
+    """
+    Scans many addresses concurrently and yields `(index, record)` pairs in input order, one as soon as it is ready,
+    so huge address lists are processed in constant memory. A scan can be resumed with `offset` set to the
+    index after the last record that was written.
+
+    :param offset: (int, default=0) Number of addresses to skip
+    :param start: (int, default=0) Index of the first address, for scans of a slice of a longer list
+    """
+    fields = tuple(fields)
+    unknown = set(fields) - set(SCAN_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown scan fields: {', '.join(sorted(unknown))}")
+
+    def call(item):
+        index, address = item
+        try:
+            return scan_address(client, address, fields)
+        except Exception as e:
+            logging.error(f"Scan of {address} failed: {e}")
+            return {"address": address, "errors": {"scan": str(e)}}
+
+    items = itertools.islice(enumerate(addresses, start), offset, None)
+    for (index, _), record in client.map_addresses(call, items, max_concurrency, ordered=True):
+        yield index, {"index": index, **record}
+
+# State of a scan worker process, set once by _init_worker
+_worker = {}
+
+def _init_worker(config, max_concurrency, rate):
+    # Ctrl+C is handled by the parent, which shuts the pool down
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    rate_limiter = RateLimiter(default={"rate": rate}) if rate else None
+    _worker["client"] = ZenonWalletClient(config, rate_limiter=rate_limiter)
+    _worker["max_concurrency"] = max_concurrency
+
+def _scan_batch(start, addresses, fields):
+    """Scans one batch in a worker. Returns the encoded NDJSON lines and the batch totals, so the parent does no JSON work."""
+    client = _worker["client"]
+    dumps = client.json_codec.dumps
+    lines = []
+    totals = {}
+    for _, record in scan(client, addresses, fields, _worker["max_concurrency"], start=start):
+        lines.append(dumps(record))
+        add_totals(totals, record)
+    lines.append(b"")
+    totals = [(tokenStandard, total.token.name, total.token.symbol, total.token.decimals, total.raw)
+              for tokenStandard, total in totals.items()]
+    return b"\n".join(lines), totals
+
+class ShardedScanner:
+
+    def __init__(self, config, processes=None, max_concurrency=10, batch_size=64, rate=None):
+        """
+        Scans addresses in several worker processes, for address lists too large for the JSON decoding
+        and balance parsing of a single process. The parent authenticates once and every worker reuses its token.
+        Workers return each batch as one block of encoded NDJSON lines plus its per-token totals,
+        which the parent writes out unchanged and adds up in `totals`.
+
+        :param config: (ZenonWalletConfig, required) Settings shared by all workers
+        :param processes: (int, optional) Worker processes; defaults to the number of CPUs
+        :param max_concurrency: (int, default=10) Addresses scanned at once within each worker
+        :param batch_size: (int, default=64) Addresses sent to a worker at a time
+        :param rate: (float, optional) Maximum requests per second per endpoint class across all workers
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        self.config = config
+        self.processes = processes or os.cpu_count() or 1
+        self.max_concurrency = max_concurrency
+        self.batch_size = batch_size
+        self.rate = rate
+        self.totals = {}
+        self.executor = None
+
+    def _start(self):
+        config = copy.copy(self.config)
+        config.pool_size = self.max_concurrency
+        if not config.token:
+            client = ZenonWalletClient(self.config)
+            try:
+                client._ensure_authenticated()
+                authorization = client.session.headers.get("Authorization")
+            finally:
+                client.close()
+            if not authorization:
+                raise ValueError("Authentication failed")
+            config.token = authorization[len("Bearer "):]
+
+        rate = self.rate / self.processes if self.rate else None
+        self.executor = ProcessPoolExecutor(max_workers=self.processes, initializer=_init_worker,
+                                            initargs=(config, self.max_concurrency, rate))
+
+    def scan(self, addresses, fields=SCAN_FIELDS, offset=0):
+        """
+        Yields `(start, count, lines)` per batch in input order, where `lines` holds the encoded NDJSON records
+        of the addresses `start` to `start + count - 1`. Only a few batches per worker are in flight,
+        so memory stays constant for any number of addresses.
+
+        :param offset: (int, default=0) Number of addresses to skip, e.g. to resume a scan
+        """
+        fields = tuple(fields)
+        unknown = set(fields) - set(SCAN_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown scan fields: {', '.join(sorted(unknown))}")
+
+        if self.executor is None:
+            self._start()
+
+        addresses = itertools.islice(addresses, offset, None)
+        pending = deque()
+        start = offset
+        while True:
+            # Two batches per worker keep every process busy while the parent writes out the oldest one
+            while len(pending) < self.processes * 2:
+                batch = list(itertools.islice(addresses, self.batch_size))
+                if not batch:
+                    break
+                pending.append((start, len(batch), self.executor.submit(_scan_batch, start, batch, fields)))
+                start += len(batch)
+
+            if not pending:
+                return
+
+            batch_start, count, future = pending.popleft()
+            lines, totals = future.result()
+            for tokenStandard, name, symbol, decimals, raw in totals:
+                total = self.totals.get(tokenStandard)
+                if total is None:
+                    token = {"name": name, "symbol": symbol, "decimals": decimals}
+                    self.totals[tokenStandard] = TokenBalance(token_info(tokenStandard, token), raw)
+                else:
+                    total.raw += raw
+            yield batch_start, count, lines
+
+    def close(self):
+        """Stops the worker processes; batches that have not started are dropped"""
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
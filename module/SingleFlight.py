@@ -0,0 +1,58 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+
+class SingleFlight:
+
+    def __init__(self):
+        """
+        Merges identical concurrent calls from many threads: the first caller for a key runs the call,
+        the others wait for it and receive the same result (or exception).
+        """
+        self.lock = threading.Lock()
+        self.calls = {}
+
+    def do(self, key, func):
+        """Runs `func()` unless a call for `key` is already in flight, and returns its result"""
+        with self.lock:
+            future = self.calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self.calls[key] = future
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = func()
+        except BaseException as e:
+            with self.lock:
+                del self.calls[key]
+            future.set_exception(e)
+            raise
+
+        # Remove the call before publishing, so later callers start a fresh request instead of reusing this result
+        with self.lock:
+            del self.calls[key]
+        future.set_result(result)
+        return result
+
+class AsyncSingleFlight:
+
+    def __init__(self):
+        """
+        Merges identical concurrent calls from many tasks: the first caller for a key starts the call,
+        the others await the same task and receive the same result (or exception).
+        """
+        self.calls = {}
+
+    async def do(self, key, func):
+        """Awaits `func()` unless a call for `key` is already in flight, and returns its result"""
+        task = self.calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self.calls[key] = task
+            task.add_done_callback(lambda _: self.calls.pop(key, None))
+        # Shield the shared task, so one cancelled caller does not cancel the call for everyone else
+        return await asyncio.shield(task)
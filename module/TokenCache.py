@@ -0,0 +1,81 @@
+import base64
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+
+class TokenCache:
+
+    def __init__(self, path, default_ttl=3600, margin=60):
+        """
+        Bearer token cache shared by every process on the host through a small JSON file.
+
+        :param path: (str, required) Location of the cache file
+        :param default_ttl: (int, default=3600) Lifetime in seconds for tokens without an `exp` claim
+        :param margin: (int, default=60) Seconds before expiry after which a cached token is no longer used
+        """
+        self.path = path
+        self.default_ttl = default_ttl
+        self.margin = margin
+
+    @staticmethod
+    def key(api_url, username):
+        """Tokens are only shared between clients of the same API and user"""
+        return hashlib.sha256(f"{api_url}\n{username}".encode()).hexdigest()
+
+    def expires_at(self, token):
+        """Reads the expiry from the `exp` claim of a JWT, or falls back to the default lifetime"""
+        try:
+            claims = token.split(".")[1]
+            claims += "=" * (-len(claims) % 4)
+            return float(json.loads(base64.urlsafe_b64decode(claims))["exp"])
+        except (IndexError, KeyError, TypeError, ValueError):
+            return time.time() + self.default_ttl
+
+    def _read(self):
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logging.warning(f"Ignoring unreadable token cache {self.path}: {e}")
+            return {}
+
+    def load(self, key):
+        """Returns the cached token for a key, or None when it is missing or about to expire"""
+        entry = self._read().get(key)
+        if entry and entry.get("expires_at", 0) - self.margin > time.time():
+            return entry.get("token")
+        return None
+
+    def _write(self, entries):
+        """Replaces the cache file atomically, so readers never see a partial write"""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        try:
+            fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".token-cache-")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(entries, f)
+                os.chmod(temp_path, 0o600)
+                os.replace(temp_path, self.path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except OSError as e:
+            logging.warning(f"Failed to write token cache {self.path}: {e}")
+
+    def store(self, key, token):
+        """Stores a token until it expires, dropping entries that already expired"""
+        now = time.time()
+        entries = {k: v for k, v in self._read().items() if v.get("expires_at", 0) > now}
+        entries[key] = {"token": token, "expires_at": self.expires_at(token)}
+        self._write(entries)
+
+    def invalidate(self, key):
+        """Removes a token, e.g. after the API rejected it"""
+        entries = self._read()
+        if entries.pop(key, None) is not None:
+            self._write(entries)
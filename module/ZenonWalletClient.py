@@ -1,44 +1,155 @@
-import os
 import sys
 import logging
+import threading
+import time
 import urllib.parse
 import requests
 import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from dotenv import load_dotenv, find_dotenv
+from .AddressValidator import is_valid_address
+from .JsonStream import iter_array_items
+from .LoadBalancer import LoadBalancer, is_read_endpoint
+from .SingleFlight import SingleFlight
+from .TokenCache import TokenCache
+from .ZenonWalletConfig import ZenonWalletConfig
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+PAGE_SIZE_LIMITS = {"received": 1024, "unreceived": 50}
+STREAM_CHUNK_SIZE = 65536
+
+def _wire_size(response):
+    """Returns the body bytes of a response read from the wire so far, before decompression"""
+    try:
+        return response.raw.tell()
+    except AttributeError:
+        return len(response.content)
+
+class ZenonWalletAPIError(Exception):
+    """
+    Raised by the block iterators when a page request fails, so a partial history is never mistaken for a complete one.
+    """
+
+    def __init__(self, endpoint, result):
+        self.endpoint = endpoint
+        self.result = result
+        super().__init__(f"API call to {endpoint} failed: {result.get('status')}")
 
 class ZenonWalletClient:
 
-    def __init__(self):
+    def __init__(self, config=None, cache=None, coalesce=False, metrics=None, rate_limiter=None, hedge=None,
+                 circuit_breaker=None, conditional=None):
         """
-        Initializes the client, checks if all required environment variables are set,
-        and ensures a valid session with authentication.
+        Initializes the client. Nothing is sent until the first request, which authenticates lazily.
+        Without a config, the settings are loaded from the .env file and the process exits when none is found.
+
+        :param config: (ZenonWalletConfig, optional) Explicit settings instead of the .env file
+        :param cache: (ResponseCache, optional) Cache for read-only ledger and utility responses
+        :param coalesce: (bool, default=False) Merge identical concurrent GET requests into a single HTTP call
+        :param metrics: (Metrics, optional) Records latency, decode time, status codes and bytes per endpoint template
+        :param rate_limiter: (RateLimiter, optional) Limits the request rate and requests in flight per endpoint class
+        :param hedge: (HedgePolicy, optional) Sends a duplicate of GET requests that are slower than usual and uses the first answer
+        :param circuit_breaker: (CircuitBreaker, optional) Fails requests fast while their endpoint keeps failing
+        :param conditional: (ConditionalCache, optional) Sends GET requests with the ETag/Last-Modified of the last answer and serves 304 answers from it
         """
-        logging.basicConfig(level=logging.DEBUG, format="%(asctime)s - %(levelname)s - %(message)s")
+        if config is None:
+            logging.basicConfig(level=logging.DEBUG, format="%(asctime)s - %(levelname)s - %(message)s")
 
-        try:
-            # Attempt to locate the .env file, and raise an error if it is not found.
-            env_file = find_dotenv(raise_error_if_not_found=True)
-            load_dotenv(env_file)
-            logging.info("Environment variables loaded from .env file.")
-        except Exception as e:
-            logging.error(f"Failed to load environment variables from .env file: {e}")
-            sys.exit(1)
-
-        self.username = os.getenv("ZENON_WALLET_API_USERNAME_ADMIN")
-        self.password = os.getenv("ZENON_WALLET_API_PASSWORD_ADMIN")
-        self.api_url = os.getenv("ZENON_WALLET_API_URL")
-        self.secret = os.getenv("ZENON_WALLET_API_SECRET")
-        self.address = os.getenv("ZENON_WALLET_API_ADDRESS")
+            try:
+                # Attempt to locate the .env file, and raise an error if it is not found.
+                env_file = find_dotenv(raise_error_if_not_found=True)
+                load_dotenv(env_file)
+                logging.info("Environment variables loaded from .env file.")
+            except Exception as e:
+                logging.error(f"Failed to load environment variables from .env file: {e}")
+                sys.exit(1)
+
+            config = ZenonWalletConfig.from_env()
+
+        self.config = config
+        self.username = config.username
+        self.password = config.password
+        self.api_url = config.api_url
+        self.secret = config.secret
+        self.address = config.address
+        self.mnemonic = config.mnemonic
 
         self.test_address = "z1qqjnwjjpnue8xmmpanz6csze6tcmtzzdtfsww7"
         self.account_address_1 = "z1qr00j9wkcyvgz567sygnjxshnkq3xqxsc0t7cv"
         self.account_address_2 = "z1qzg4377yxss6m0duu38ntc0zu3s0thn9rwze3f"
 
-        self.session = requests.Session()
+        self.cache = cache
+        self.single_flight = SingleFlight() if coalesce else None
+        self.metrics = metrics
+        self.rate_limiter = rate_limiter
+        self.hedge = hedge
+        self.circuit_breaker = circuit_breaker
+        self.conditional = conditional
+        # Read-only calls are spread over the read instances; everything else stays on the primary api_url
+        self.load_balancer = LoadBalancer(config.read_urls) if config.read_urls else None
+        self.json_codec = config.json_codec
+        self.token_cache = TokenCache(config.token_cache_path) if config.token_cache_path else None
+        self.auth_lock = threading.Lock()
 
-        # Authenticate if no token is present in the session headers
-        if not self.session.headers.get("Authorization"):
-            self.authenticate()
+        self.session = requests.Session()
+        pool_size = config.pool_size or 10
+        # Connections are kept alive and reused from the pool; retries are handled in _send
+        adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"Connection": "keep-alive"})
+
+        if config.token:
+            self.session.headers.update({"Authorization": f"Bearer {config.token}"})
+
+        # Hedged requests need both attempts off the calling thread, so the first answer can be returned at once.
+        # The pool is sized by the policy, and a request that finds no free thread is sent directly instead of queueing.
+        self.hedge_executor = ThreadPoolExecutor(max_workers=hedge.max_workers, thread_name_prefix="hedge") if hedge is not None else None
+        self.hedge_slots = threading.BoundedSemaphore(hedge.max_workers) if hedge is not None else None
+
+    def _ensure_authenticated(self):
+        """
+        Authenticates once before the first request, reusing a token from the token cache when possible.
+        """
+        with self.auth_lock:
+            if self.session.headers.get("Authorization"):
+                return
+
+            if self.token_cache is not None:
+                key = TokenCache.key(self.api_url, self.username)
+                token = self.token_cache.load(key)
+                if token:
+                    self.session.headers.update({"Authorization": f"Bearer {token}"})
+                    return
+
+            token = self.authenticate()
+            if token and self.token_cache is not None:
+                self.token_cache.store(key, token)
+
+    def _refresh_token(self, rejected):
+        """
+        Replaces a token the API rejected. When another thread already replaced it, its new token is used instead.
+        Returns True when a different token is available.
+        """
+        with self.auth_lock:
+            current = self.session.headers.get("Authorization")
+            if current and current != rejected:
+                return True
+
+            self.session.headers.pop("Authorization", None)
+            if self.token_cache is not None:
+                key = TokenCache.key(self.api_url, self.username)
+                cached = self.token_cache.load(key)
+                if cached and f"Bearer {cached}" != rejected:
+                    self.session.headers.update({"Authorization": f"Bearer {cached}"})
+                    return True
+                self.token_cache.invalidate(key)
+
+            token = self.authenticate()
+            if token and self.token_cache is not None:
+                self.token_cache.store(key, token)
+            return token is not None
 
     def authenticate(self):
         """
@@ -57,7 +168,7 @@ class ZenonWalletClient:
         }
 
         try:
-            response = self.session.post(url, headers=headers, data=payload)
+            response = self.session.post(url, headers=headers, data=payload, timeout=self.config.timeout)
             logging.info(f"Authentication response: {response.status_code}")
             response.raise_for_status()
 
@@ -77,34 +188,407 @@ class ZenonWalletClient:
             logging.error(f"Request failed: {e}")
             return None
 
-    def request(self, endpoint, method="GET", payload=None):
+    def request(self, endpoint, method="GET", payload=None, raw=False):
         """
         Performs an API request with the specified endpoint and method.
+        Read-only responses are served from the cache when one is configured,
+        and identical concurrent GET requests are merged when coalescing is enabled.
+
+        :param raw: (bool, default=False) Return the response body as bytes without decoding it; raw responses are never cached
+        """
+        ttl = self.cache.ttl(endpoint) if self.cache is not None and not raw else None
+        if ttl:
+            cached = self.cache.get(endpoint)
+            if self.metrics is not None:
+                self.metrics.increment("cache_hits" if cached is not None else "cache_misses", endpoint)
+            if cached is not None:
+                return cached
+            generation = self.cache.generation(endpoint)
+
+        if self.hedge is not None and method.upper() == "GET":
+            send = lambda: self._hedged_send(endpoint, method, payload, raw)
+        else:
+            send = lambda: self._send(endpoint, method, payload, raw)
+
+        if self.single_flight is not None and method.upper() != "POST":
+            result = self.single_flight.do((endpoint, raw), send)
+        else:
+            result = send()
+
+        if self.cache is not None:
+            if ttl:
+                if result["status"] is not None:
+                    self.cache.set(endpoint, result, ttl, generation)
+            elif method.upper() == "POST":
+                # Writes change the state of the addresses they touch, so drop their cached reads
+                self.cache.invalidate_write(endpoint, payload)
+
+        return result
+
+    def _attempt(self, method, endpoint, body=None, headers=None, stream=False):
+        """
+        Sends a request until it gets an answer that is not retried.
+        Every attempt asks the circuit breaker, the rate limiter and the load balancer first and reports its outcome to them.
+        A rejected token is refreshed and the request replayed once, and idempotent requests are retried with backoff
+        after connection errors, timeouts and transient server errors. Retried attempts are recorded in the metrics;
+        the caller records the final one.
+
+        :param body: (bytes, optional) Encoded JSON payload of a POST request
+        :param headers: (dict, optional) Extra request headers
+        :param stream: (bool, default=False) Return once the headers arrive; the caller reads and closes the body
+        :return: `(response, start)`, or None when the circuit of the endpoint is open
+        :raises requests.exceptions.RequestException: when the last attempt got no answer
+        """
+        # Authenticate if no token is present in the session headers
+        if not self.session.headers.get("Authorization"):
+            self._ensure_authenticated()
+
+        balancer = self.load_balancer if self.load_balancer is not None and is_read_endpoint(method, endpoint) else None
+        base_url = self.api_url
+        retry_policy = self.config.retry_policy
+        retries = retry_policy.retries_for(method, endpoint)
+        attempt = 0
+        reauthenticated = False
+
+        metrics = self.metrics
+        breaker = self.circuit_breaker
+        limiter = self.rate_limiter.limiter(endpoint) if self.rate_limiter is not None else None
+        bytes_sent = len(body or b"")
+
+        while True:
+            if breaker is not None and not breaker.allow(endpoint):
+                # The endpoint keeps failing; fail fast instead of adding to the pile-up
+                if metrics is not None:
+                    metrics.increment("circuit_open", endpoint)
+                if logging.root.isEnabledFor(logging.DEBUG):
+                    logging.debug(f"Circuit for {endpoint} is open. Failing fast.")
+                return None
+            if limiter is not None and limiter.acquire() and metrics is not None:
+                metrics.increment("rate_limited", endpoint)
+            if balancer is not None:
+                # A retry goes to another instance when one is available
+                base_url = balancer.acquire(exclude=(base_url,) if attempt else ())
+            url = urllib.parse.urljoin(base_url, endpoint)
+            authorization = self.session.headers.get("Authorization")
+            start = time.perf_counter()
+            try:
+                if method.upper() == "POST":
+                    response = self.session.post(url, data=body, headers=headers, timeout=self.config.timeout, stream=stream)
+                else:
+                    response = self.session.get(url, headers=headers, timeout=self.config.timeout, stream=stream)
+            except requests.exceptions.RequestException as e:
+                latency = time.perf_counter() - start
+                self._release(endpoint, base_url, limiter, balancer, latency, None)
+                if metrics is not None:
+                    metrics.record_request(method, endpoint, None, latency, bytes_sent=bytes_sent)
+                if attempt < retries and isinstance(e, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+                    delay = retry_policy.delay(attempt)
+                    logging.warning(f"Request to {endpoint} failed: {e}. Retrying in {delay:.2f} seconds.")
+                    if metrics is not None:
+                        metrics.increment("retries", endpoint)
+                    time.sleep(delay)
+                    attempt += 1
+                    continue
+                raise
+
+            # requests reads the whole body before returning unless it streams, so this is the network time;
+            # a streamed body is still arriving, and the limiter and balancer see the time until the headers
+            latency = time.perf_counter() - start
+            self._release(endpoint, base_url, limiter, balancer, latency, response.status_code)
+
+            if response.status_code == 401 and not reauthenticated:
+                # The token expired or was revoked; a rejected request was not processed, so it is safe to replay
+                reauthenticated = True
+                if self._refresh_token(authorization):
+                    if metrics is not None:
+                        metrics.record_request(method, endpoint, 401, latency, 0.0, bytes_sent, _wire_size(response),
+                                               0 if stream else len(response.content))
+                        metrics.increment("token_refreshes", endpoint)
+                    response.close()
+                    continue
+            elif response.status_code in retry_policy.retry_statuses and attempt < retries:
+                delay = retry_policy.delay(attempt, response.headers.get("Retry-After"))
+                logging.warning(f"API Response ({method} {endpoint}): {response.status_code}. Retrying in {delay:.2f} seconds.")
+                if metrics is not None:
+                    metrics.record_request(method, endpoint, response.status_code, latency, 0.0, bytes_sent,
+                                           _wire_size(response), 0 if stream else len(response.content))
+                    metrics.increment("retries", endpoint)
+                response.close()
+                time.sleep(delay)
+                attempt += 1
+                continue
+            return response, start
+
+    def _send(self, endpoint, method="GET", payload=None, raw=False):
+        """
+        Sends a single API request.
         This method builds the full URL, sends the request,
         and handles the response (including error handling and JSON decoding).
+        A rejected token is refreshed and the request replayed once, and idempotent requests
+        are retried with backoff after connection errors and transient server errors.
         """
-        url = urllib.parse.urljoin(self.api_url, endpoint)
+        metrics = self.metrics
+        body = self.json_codec.dumps(payload) if method.upper() == "POST" and payload is not None else None
+        conditional = self.conditional if method.upper() != "POST" else None
+        stored = conditional.get((endpoint, raw)) if conditional is not None else None
+        if body is not None:
+            headers = JSON_HEADERS
+        else:
+            headers = conditional.headers(stored) if stored is not None else None
+
         try:
-            if method.upper() == "POST":
-                response = self.session.post(url, json=payload)
-            else:
-                response = self.session.get(url)
-            
-            logging.info(f"API Response ({method} {endpoint}): {response.status_code}")
+            answer = self._attempt(method, endpoint, body, headers)
+        except requests.exceptions.RequestException as e:
+            logging.error(f"Request to {endpoint} failed: {e}")
+            return {"status": None, "data": None}
+        if answer is None:
+            return {"status": None, "data": None}
+        response, start = answer
+        latency = time.perf_counter() - start
+
+        decode_time = 0.0
+        try:
+            if logging.root.isEnabledFor(logging.DEBUG):
+                logging.debug(f"API Response ({method} {endpoint}): {response.status_code}")
             response.raise_for_status()
 
+            if metrics is not None and response.headers.get("Content-Encoding"):
+                metrics.increment("compressed", endpoint)
+
+            if stored is not None:
+                conditional.record(response.status_code == 304)
+                if response.status_code == 304:
+                    # Not modified: the stored body is still current and was neither downloaded nor decoded again
+                    if metrics is not None:
+                        metrics.increment("not_modified", endpoint)
+                    return {"status": 200, "data": stored[2]}
+
+            if raw:
+                if conditional is not None and response.status_code == 200:
+                    conditional.set((endpoint, raw), response.headers.get("ETag"), response.headers.get("Last-Modified"),
+                                    response.content, len(response.content))
+                return {"status": response.status_code, "data": response.content}
+
+            decode_start = time.perf_counter()
             try:
-                data = response.json()
-            except requests.exceptions.JSONDecodeError:
+                data = self.json_codec.loads(response.content)
+            except ValueError:
                 logging.warning(f"Response from {endpoint} is not JSON. Returning raw text.")
                 data = response.text
+            decode_time = time.perf_counter() - decode_start
 
+            if conditional is not None and response.status_code == 200:
+                conditional.set((endpoint, raw), response.headers.get("ETag"), response.headers.get("Last-Modified"), data,
+                                len(response.content))
             return {"status": response.status_code, "data": data}
 
         except requests.exceptions.RequestException as e:
             logging.error(f"Request to {endpoint} failed: {e}")
             return {"status": None, "data": None}
 
+        finally:
+            if metrics is not None:
+                metrics.record_request(method, endpoint, response.status_code, latency, decode_time,
+                                       len(body or b""), _wire_size(response), len(response.content))
+
+    def _hedged_send(self, endpoint, method="GET", payload=None, raw=False):
+        """
+        Sends an idempotent request and, when it has not been answered within the hedge delay of its endpoint,
+        a duplicate. The first successful answer is returned; the other request finishes in the background.
+        """
+        hedge = self.hedge
+
+        def send():
+            start = time.perf_counter()
+            result = self._send(endpoint, method, payload, raw)
+            if result["status"] is not None:
+                hedge.record(endpoint, time.perf_counter() - start)
+            return result
+
+        def submit():
+            # Returns None when every hedge thread is busy, so callers never queue behind other requests
+            if not self.hedge_slots.acquire(blocking=False):
+                return None
+            future = self.hedge_executor.submit(send)
+            future.add_done_callback(lambda _: self.hedge_slots.release())
+            return future
+
+        delay = hedge.delay(endpoint)
+        if delay is None:
+            return send()
+
+        first = submit()
+        if first is None:
+            return send()
+        done, _ = wait((first,), timeout=delay)
+        if done or not hedge.try_hedge():
+            return first.result()
+
+        second = submit()
+        if second is None:
+            return first.result()
+        if self.metrics is not None:
+            self.metrics.increment("hedges", endpoint)
+        pending = {first, second}
+        result = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                if result["status"] is not None:
+                    return result
+        return result
+
+    def _release(self, endpoint, base_url, limiter, balancer, latency, status):
+        """Reports the outcome of one HTTP attempt to the rate limiter, the load balancer and the circuit breaker"""
+        if limiter is not None:
+            limiter.release(latency, status)
+        if balancer is not None:
+            balancer.release(base_url, latency, status)
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record(endpoint, status)
+
+    def map_addresses(self, func, addresses, max_concurrency=10, ordered=True):
+        """
+        Calls `func(address)` for every address on a bounded thread pool and yields `(address, result)` pairs.
+        At most `max_concurrency` requests are in flight, and a failure only affects the result of its own address.
+
+        :param ordered: (bool, default=True) Yield results in input order, otherwise as each one completes
+        """
+        if not isinstance(max_concurrency, int):
+            raise TypeError(f"max_concurrency must be an integer, got {type(max_concurrency).__name__}")
+
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        def call(address):
+            try:
+                return func(address)
+            except Exception as e:
+                logging.error(f"Request for {address} failed: {e}")
+                return {"status": None, "data": None}
+
+        addresses = iter(addresses)
+        # Keep a small window of queued work so huge address lists are never fully materialized
+        window = max_concurrency * 2
+
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            pending = deque() if ordered else {}
+
+            def submit_next():
+                for address in addresses:
+                    future = executor.submit(call, address)
+                    if ordered:
+                        pending.append((address, future))
+                    else:
+                        pending[future] = address
+                    return True
+                return False
+
+            while len(pending) < window and submit_next():
+                pass
+
+            while pending:
+                if ordered:
+                    address, future = pending.popleft()
+                    yield address, future.result()
+                    submit_next()
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield pending.pop(future), future.result()
+                        submit_next()
+
+    def _iter_pages(self, fetch, name, address, pageSize):
+        """
+        Yields the blocks of every page returned by `fetch`, one block at a time.
+        The next page is requested on a background thread while the caller works through the current one,
+        so at most two pages are held in memory.
+        """
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pageIndex = 0
+            future = executor.submit(fetch, address, pageIndex=pageIndex, pageSize=pageSize)
+            while future is not None:
+                result = future.result()
+                if result.get("status") != 200:
+                    raise ZenonWalletAPIError(f"/api/ledger/{address}/{name}?pageIndex={pageIndex}", result)
+
+                data = result.get("data") or {}
+                blocks = data.get("list") or []
+                more = data.get("more", len(blocks) == pageSize)
+                del result, data
+
+                pageIndex += 1
+                future = executor.submit(fetch, address, pageIndex=pageIndex, pageSize=pageSize) if more and blocks else None
+                yield from blocks
+
+    def _stream_list(self, endpoint, info):
+        """
+        Sends a GET request and yields the items of the `list` member while the body is still arriving,
+        so only one item is decoded at a time. The other members are stored in `info`.
+        Until the body is consumed nothing has been yielded, so the request is retried like any other GET.
+        """
+        try:
+            answer = self._attempt("GET", endpoint, stream=True)
+            if answer is None:
+                raise ZenonWalletAPIError(endpoint, {"status": None, "data": None})
+            response, _ = answer
+
+            with response:
+                if logging.root.isEnabledFor(logging.DEBUG):
+                    logging.debug(f"API Response (GET {endpoint}): {response.status_code}")
+                if response.status_code != 200:
+                    raise ZenonWalletAPIError(endpoint, {"status": response.status_code, "data": None})
+                if self.metrics is None:
+                    yield from iter_array_items(response.iter_content(chunk_size=STREAM_CHUNK_SIZE), info=info)
+                    return
+
+                # Network and decode time interleave while streaming, so the whole transfer counts as latency
+                start = time.perf_counter()
+                received = 0
+
+                def chunks():
+                    nonlocal received
+                    for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                        received += len(chunk)
+                        yield chunk
+
+                try:
+                    yield from iter_array_items(chunks(), info=info)
+                finally:
+                    self.metrics.record_request("GET", endpoint, response.status_code, time.perf_counter() - start,
+                                                bytes_received=_wire_size(response), bytes_decoded=received)
+
+        except requests.exceptions.RequestException as e:
+            logging.error(f"Request to {endpoint} failed: {e}")
+            raise ZenonWalletAPIError(endpoint, {"status": None, "data": None}) from e
+        except ValueError as e:
+            logging.error(f"Response from {endpoint} is not a valid block list: {e}")
+            raise ZenonWalletAPIError(endpoint, {"status": 200, "data": None}) from e
+
+    def _iter_streamed_pages(self, name, address, pageSize):
+        """
+        Yields the blocks of every page one at a time, decoding each page incrementally from the socket.
+        Pages are requested one after another, so memory stays bounded by a single block.
+        """
+        if not isinstance(pageSize, int):
+            raise TypeError(f"pageSize must be an integer, got {type(pageSize).__name__}")
+
+        if not (1 <= pageSize <= PAGE_SIZE_LIMITS[name]):
+            raise ValueError(f"pageSize must be between 1 and {PAGE_SIZE_LIMITS[name]}")
+
+        pageIndex = 0
+        while True:
+            info = {}
+            count = 0
+            for block in self._stream_list(f"/api/ledger/{address}/{name}?pageIndex={pageIndex}&pageSize={pageSize}", info):
+                count += 1
+                yield block
+
+            if not count or not info.get("more", count == pageSize):
+                return
+            pageIndex += 1
+
     # Specific API methods
 
     # AutoReceiver
@@ -126,6 +610,17 @@ class ZenonWalletClient:
         """Get the account info by address"""
         return self.request(f"/api/ledger/{address}/balances")
 
+    def ledger_account_info_many(self, addresses, max_concurrency=10, ordered=True):
+        """
+        Get the account info for many addresses concurrently
+
+        :param addresses: (iterable of str, required)
+        :param max_concurrency: (int, default=10) Maximum number of requests in flight
+        :param ordered: (bool, default=True) Yield in input order, otherwise as each request completes
+        :return: generator of `(address, result)` pairs
+        """
+        return self.map_addresses(self.ledger_account_info, addresses, max_concurrency, ordered)
+
     def ledger_received_account_blocks(self, address, **kwargs):
         """
         Get all received account blocks by address
@@ -133,9 +628,11 @@ class ZenonWalletClient:
         :param address: (str, required)
         :param pageIndex: (int, default=0)
         :param pageSize: (int, default=1024, must be between 1 and 1024 inclusive)
+        :param raw: (bool, default=False) Return the undecoded response body as bytes
         """
         pageIndex = kwargs.get('pageIndex', 0)
         pageSize = kwargs.get('pageSize', 1024)
+        raw = kwargs.get('raw', False)
 
         if not isinstance(pageIndex, int):
             raise TypeError(f"pageIndex must be an integer, got {type(pageIndex).__name__}")
@@ -146,7 +643,7 @@ class ZenonWalletClient:
         if not (1 <= pageSize <= 1024):
             raise ValueError("pageSize must be between 1 and 1024")
 
-        return self.request(f"/api/ledger/{address}/received?pageIndex={pageIndex}&pageSize={pageSize}")
+        return self.request(f"/api/ledger/{address}/received?pageIndex={pageIndex}&pageSize={pageSize}", raw=raw)
 
     def ledger_unreceived_account_blocks(self, address, **kwargs):
         """
@@ -155,9 +652,11 @@ class ZenonWalletClient:
         :param address: (str, required)
         :param pageIndex: (int, default=0)
         :param pageSize: (int, default=50, must be between 1 and 50 inclusive)
+        :param raw: (bool, default=False) Return the undecoded response body as bytes
         """
         pageIndex = kwargs.get('pageIndex', 0)
         pageSize = kwargs.get('pageSize', 50)
+        raw = kwargs.get('raw', False)
 
         if not isinstance(pageIndex, int):
             raise TypeError(f"pageIndex must be an integer, got {type(pageIndex).__name__}")
@@ -168,12 +667,51 @@ class ZenonWalletClient:
         if not (1 <= pageSize <= 50):
             raise ValueError("pageSize must be between 1 and 50")
             
-        return self.request(f"/api/ledger/{address}/unreceived?pageIndex={pageIndex}&pageSize={pageSize}")
+        return self.request(f"/api/ledger/{address}/unreceived?pageIndex={pageIndex}&pageSize={pageSize}", raw=raw)
+
+    def iter_received_blocks(self, address, pageSize=1024, stream=False):
+        """
+        Iterate over all received account blocks by address, fetching the next page in the background
+
+        :param address: (str, required)
+        :param pageSize: (int, default=1024, must be between 1 and 1024 inclusive)
+        :param stream: (bool, default=False) Decode each page incrementally while it downloads instead of prefetching
+                       whole pages, so memory is bounded by a single block
+        :raises ZenonWalletAPIError: when a page request fails
+        """
+        if stream:
+            return self._iter_streamed_pages("received", address, pageSize)
+        return self._iter_pages(self.ledger_received_account_blocks, "received", address, pageSize)
+
+    def iter_unreceived_blocks(self, address, pageSize=50, stream=False):
+        """
+        Iterate over all unreceived account blocks by address, fetching the next page in the background
+
+        :param address: (str, required)
+        :param pageSize: (int, default=50, must be between 1 and 50 inclusive)
+        :param stream: (bool, default=False) Decode each page incrementally while it downloads instead of prefetching
+                       whole pages, so memory is bounded by a single block
+        :raises ZenonWalletAPIError: when a page request fails
+        """
+        if stream:
+            return self._iter_streamed_pages("unreceived", address, pageSize)
+        return self._iter_pages(self.ledger_unreceived_account_blocks, "unreceived", address, pageSize)
 
     def ledger_plasma_info(self, address):
         """Retrieves plasma information for the wallet address."""
         return self.request(f"/api/ledger/{address}/plasma")
 
+    def ledger_plasma_info_many(self, addresses, max_concurrency=10, ordered=True):
+        """
+        Retrieves plasma information for many addresses concurrently
+
+        :param addresses: (iterable of str, required)
+        :param max_concurrency: (int, default=10) Maximum number of requests in flight
+        :param ordered: (bool, default=True) Yield in input order, otherwise as each request completes
+        :return: generator of `(address, result)` pairs
+        """
+        return self.map_addresses(self.ledger_plasma_info, addresses, max_concurrency, ordered)
+
     def ledger_fusion_entries(self, address):
         """Get all fusion entries by address"""
         return self.request(f"/api/ledger/{address}/fused")
@@ -235,7 +773,7 @@ class ZenonWalletClient:
 
     def wallet_restore(self):
         """Sends a request to restore an existing wallet"""
-        return self.request("/api/wallet/restore", method="POST", payload={"password": self.secret, "mnemonic": os.getenv("ZENON_WALLET_API_MNEMONIC")})
+        return self.request("/api/wallet/restore", method="POST", payload={"password": self.secret, "mnemonic": self.mnemonic})
 
     def wallet_lock(self):
         """Sends a request to lock the wallet"""
@@ -258,7 +796,24 @@ class ZenonWalletClient:
         """Validate an wallet address"""
         return self.request(f"/api/utilities/address/validate?address={address}", method="POST")
 
+    def validate_addresses(self, addresses, remote=False, max_concurrency=10, ordered=True):
+        """
+        Validate many wallet addresses
+        Addresses are checked locally (bech32 format and checksum) without any network call,
+        and each result is `{"status": 200, "data": valid}`.
+
+        :param addresses: (iterable of str, required)
+        :param remote: (bool, default=False) Ask the server endpoint instead, `max_concurrency` requests at a time
+        :param ordered: (bool, default=True) With `remote=True`, yield in input order, otherwise as each request completes
+        :return: generator of `(address, result)` pairs, like the other `*_many` methods
+        """
+        if remote:
+            return self.map_addresses(self.validate_address, addresses, max_concurrency, ordered)
+        return ((address, {"status": 200, "data": is_valid_address(address)}) for address in addresses)
+
     # Close
     def close(self):
         """Closes the session."""
+        if self.hedge_executor is not None:
+            self.hedge_executor.shutdown(wait=False)
         self.session.close()
\ No newline at end of file
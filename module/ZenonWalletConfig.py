@@ -0,0 +1,74 @@
+import os
+from dotenv import load_dotenv
+from .JsonCodec import default_codec
+from .RetryPolicy import RetryPolicy
+
+class ZenonWalletConfig:
+
+    def __init__(self, api_url, username=None, password=None, secret=None, address=None, mnemonic=None,
+                 pool_size=None, token=None, token_cache_path=None, timeout=30, retry_policy=None, json_codec=None,
+                 read_urls=None):
+        """
+        Explicit client settings, so a client can be created without a .env file or any work before the first request.
+
+        :param api_url: (str, required) Base URL of the Wallet API
+        :param username: (str, optional) Admin username used to authenticate
+        :param password: (str, optional) Admin password used to authenticate
+        :param secret: (str, optional) Wallet password used to initialize, restore and unlock the wallet
+        :param address: (str, optional) Primary wallet address, used as the default sender
+        :param mnemonic: (str, optional) Mnemonic used to restore the wallet
+        :param pool_size: (int, optional) Maximum number of pooled connections; the client picks a default when None
+        :param token: (str, optional) Bearer token to use instead of authenticating
+        :param token_cache_path: (str, optional) File where the bearer token is shared with other processes until it expires
+        :param timeout: (float, default=30) Seconds to wait for a response before the request fails; None waits forever
+        :param retry_policy: (RetryPolicy, optional) Retries for idempotent requests; defaults to RetryPolicy()
+        :param json_codec: (JsonCodec, optional) JSON encoder/decoder for bodies; defaults to orjson when installed
+        :param read_urls: (list of str, optional) Instances that answer read-only ledger and utility calls; include `api_url` to read from the primary too
+        """
+        if not api_url:
+            raise ValueError("api_url is required")
+
+        if pool_size is not None:
+            if not isinstance(pool_size, int):
+                raise TypeError(f"pool_size must be an integer, got {type(pool_size).__name__}")
+
+            if pool_size < 1:
+                raise ValueError("pool_size must be at least 1")
+
+        self.api_url = api_url
+        self.username = username
+        self.password = password
+        self.secret = secret
+        self.address = address
+        self.mnemonic = mnemonic
+        self.pool_size = pool_size
+        self.token = token
+        self.token_cache_path = token_cache_path
+        self.timeout = timeout
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.json_codec = json_codec if json_codec is not None else default_codec()
+        self.read_urls = list(read_urls) if read_urls else None
+
+    @classmethod
+    def from_env(cls, env_file=None, **kwargs):
+        """
+        Reads the settings from the ZENON_WALLET_API_* environment variables.
+        Keyword arguments override or extend the values from the environment.
+
+        :param env_file: (str, optional) .env file to load before reading the environment
+        """
+        if env_file:
+            load_dotenv(env_file)
+
+        settings = {
+            "api_url": os.getenv("ZENON_WALLET_API_URL"),
+            "username": os.getenv("ZENON_WALLET_API_USERNAME_ADMIN"),
+            "password": os.getenv("ZENON_WALLET_API_PASSWORD_ADMIN"),
+            "secret": os.getenv("ZENON_WALLET_API_SECRET"),
+            "address": os.getenv("ZENON_WALLET_API_ADDRESS"),
+            "mnemonic": os.getenv("ZENON_WALLET_API_MNEMONIC"),
+            "token_cache_path": os.getenv("ZENON_WALLET_API_TOKEN_CACHE"),
+            "read_urls": [url.strip() for url in os.getenv("ZENON_WALLET_API_READ_URLS", "").split(",") if url.strip()],
+        }
+        settings.update(kwargs)
+        return cls(**settings)
@@ -1 +1,24 @@
-from .ZenonWalletClient import ZenonWalletClient
\ No newline at end of file
+from .ZenonWalletConfig import ZenonWalletConfig
+from .ZenonWalletClient import ZenonWalletClient, ZenonWalletAPIError
+from .AsyncZenonWalletClient import AsyncZenonWalletClient
+from .BlockIndex import BlockIndex
+from .ResponseCache import ResponseCache
+from .SingleFlight import SingleFlight, AsyncSingleFlight
+from .TokenCache import TokenCache
+from .RetryPolicy import RetryPolicy
+from .PlasmaWatcher import PlasmaWatcher
+from .PayoutScheduler import PayoutScheduler
+from .BlockReceiver import BlockReceiver
+from .Balances import TokenInfo, TokenBalance, parse_balances, get_balances, get_balances_many, total_balances
+from .JsonCodec import JsonCodec, default_codec
+from .JsonStream import JsonArrayStream, iter_array_items
+from .AddressValidator import is_valid_address, validate_addresses
+from .Metrics import Metrics, StatsDExporter, endpoint_template
+from .RateLimiter import RateLimiter, EndpointLimiter, endpoint_class
+from .LoadBalancer import LoadBalancer, is_read_endpoint
+from .HedgePolicy import HedgePolicy
+from .CircuitBreaker import CircuitBreaker
+from .ConditionalCache import ConditionalCache
+from .Scanner import scan, scan_address, add_totals, ShardedScanner, SCAN_FIELDS
+from .FusionTracker import FusionTracker, parse_expiration
+from .BlockExporter import export_blocks, block_row, BlockExportError, CsvBlockWriter, ColumnarBlockWriter
@@ -0,0 +1,140 @@
+import argparse
+import logging
+import os
+import sys
+from dotenv import find_dotenv
+from .BlockExporter import BlockExportError, export_blocks
+from .RateLimiter import RateLimiter
+from .Scanner import SCAN_FIELDS, ShardedScanner, add_totals, scan
+from .ZenonWalletClient import ZenonWalletAPIError, ZenonWalletClient
+from .ZenonWalletConfig import ZenonWalletConfig
+
+def read_addresses(stream):
+    """Yields one address per non-empty line, skipping comments"""
+    for line in stream:
+        address = line.strip()
+        if address and not address.startswith("#"):
+            yield address
+
+def load_config(args):
+    env_file = args.env_file or find_dotenv(usecwd=True) or None
+    return ZenonWalletConfig.from_env(env_file=env_file, pool_size=getattr(args, "concurrency", None))
+
+def print_totals(totals):
+    for tokenStandard, total in sorted(totals.items()):
+        print(f"{total.token.symbol} {total.format()} ({tokenStandard})", file=sys.stderr)
+
+def command_scan(args):
+    """Writes one NDJSON record per address to stdout"""
+    fields = tuple(field.strip() for field in args.fields.split(",") if field.strip())
+    config = load_config(args)
+    source = sys.stdin if args.input == "-" else open(args.input)
+    out = sys.stdout.buffer
+    next_offset = args.offset
+    totals = {}
+
+    if args.processes != 1:
+        scanner = ShardedScanner(config, args.processes or None, args.concurrency, rate=args.rate)
+        client = None
+        totals = scanner.totals
+    else:
+        scanner = None
+        rate_limiter = RateLimiter(default={"rate": args.rate}) if args.rate else None
+        client = ZenonWalletClient(config, rate_limiter=rate_limiter)
+
+    try:
+        if scanner is not None:
+            for start, count, lines in scanner.scan(read_addresses(source), fields, args.offset):
+                out.write(lines)
+                out.flush()
+                next_offset = start + count
+        else:
+            dumps = client.json_codec.dumps
+            for index, record in scan(client, read_addresses(source), fields, args.concurrency, args.offset):
+                # One flushed line per address, so an interrupted scan can be resumed from the last line
+                out.write(dumps(record) + b"\n")
+                out.flush()
+                next_offset = index + 1
+                if args.totals:
+                    add_totals(totals, record)
+    except KeyboardInterrupt:
+        logging.warning(f"Interrupted. Resume with --offset {next_offset}")
+        return 130
+    except BrokenPipeError:
+        # The reader went away, e.g. `| head`; stop quietly
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+    finally:
+        if scanner is not None:
+            scanner.close()
+        if client is not None:
+            client.close()
+        if source is not sys.stdin:
+            source.close()
+
+    if args.totals:
+        print_totals(totals)
+    return 0
+
+def command_export(args):
+    """Writes the received blocks of every address to one CSV, Parquet or Arrow file"""
+    client = ZenonWalletClient(load_config(args))
+    source = sys.stdin if args.input == "-" else open(args.input)
+    output = sys.stdout if args.output == "-" else args.output
+    errors = {}
+    try:
+        count = export_blocks(client, read_addresses(source), output, args.format, args.page_size, args.row_group_size,
+                              args.page_index, args.resume, args.overwrite, args.from_address, errors)
+    except BlockExportError as e:
+        logging.error(e)
+        logging.warning(f"Resume with --from-address {e.address} --page-index {e.pageIndex} --resume")
+        return 2
+    finally:
+        client.close()
+        if source is not sys.stdin:
+            source.close()
+    if errors:
+        logging.warning(f"Skipped {len(errors)} addresses: {', '.join(f'{address} ({reason})' for address, reason in errors.items())}")
+    logging.info(f"Exported {count} blocks")
+    return 0
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m module", description="Command-line tools for the ZNN Wallet API")
+    parser.add_argument("--env-file", help="File with the ZENON_WALLET_API_* settings; defaults to the nearest .env")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Log every request to stderr")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    scan_parser = commands.add_parser("scan", help="Query the balances, plasma and fusion entries of many addresses as NDJSON")
+    scan_parser.add_argument("input", nargs="?", default="-", help="File with one address per line; - or nothing reads stdin")
+    scan_parser.add_argument("--fields", default=",".join(SCAN_FIELDS), help=f"Comma-separated data to query (default: {','.join(SCAN_FIELDS)})")
+    scan_parser.add_argument("--concurrency", type=int, default=10, help="Addresses scanned at once (default: 10)")
+    scan_parser.add_argument("--rate", type=float, help="Maximum requests per second per endpoint class")
+    scan_parser.add_argument("--processes", type=int, default=1, help="Worker processes that share the scan; 0 uses one per CPU (default: 1)")
+    scan_parser.add_argument("--totals", action="store_true", help="Print the total balance per token to stderr at the end")
+    scan_parser.add_argument("--offset", type=int, default=0, help="Skip this many addresses, e.g. to resume a scan")
+    scan_parser.set_defaults(handler=command_scan)
+
+    export_parser = commands.add_parser("export", help="Export the received blocks of many addresses to CSV, Parquet or Arrow")
+    export_parser.add_argument("input", nargs="?", default="-", help="File with one address per line; - or nothing reads stdin")
+    export_parser.add_argument("-o", "--output", default="-", help="Output file; the extension picks the format (default: CSV to stdout)")
+    export_parser.add_argument("--format", choices=("csv", "parquet", "arrow"), help="Output format instead of the file extension")
+    export_parser.add_argument("--page-size", type=int, default=1024, help="Blocks per page request (default: 1024)")
+    export_parser.add_argument("--from-address", help="Skip the input addresses before this one, e.g. to resume an export")
+    export_parser.add_argument("--page-index", type=int, default=0, help="Page to start the first exported address at, e.g. to resume an export")
+    export_parser.add_argument("--resume", action="store_true", help="Add to the .partial file of an interrupted export")
+    export_parser.add_argument("--overwrite", action="store_true", help="Replace the .partial file of an interrupted export")
+    export_parser.add_argument("--row-group-size", type=int, default=65536, help="Rows per Parquet row group or Arrow batch (default: 65536)")
+    export_parser.set_defaults(handler=command_export)
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING, stream=sys.stderr,
+                        format="%(asctime)s - %(levelname)s - %(message)s")
+
+    try:
+        return args.handler(args)
+    except (ValueError, OSError, ImportError, ZenonWalletAPIError) as e:
+        logging.error(e)
+        return 2
+
+if __name__ == "__main__":
+    sys.exit(main())